@@ -0,0 +1,320 @@
+"""
+Benchmarks of ttk-text widgets.
+
+The benchmarks need a display, on Linux they can run under Xvfb:
+
+.. code-block:: bash
+
+    xvfb-run -a uv run benchmarks/bench_ttk_text.py --output results.json
+    xvfb-run -a uv run benchmarks/bench_ttk_text.py --compare results.json
+
+Every result is a cost where lower is better: seconds per operation, bytes or Tcl commands per widget.
+The best of the repeats is reported, and ``--compare`` exits with status 1 when a result regressed by
+more than the threshold against a previous JSON report.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from tkinter import Misc, Tk
+from tkinter.ttk import Frame, Style
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from ttk_text import ThemedText
+from ttk_text.scrolled_text import ScrolledText
+
+
+class Measurement(NamedTuple):
+    """Measured time or amount, and the number of operations it covers."""
+
+    total: float
+    operations: int
+
+
+class Benchmark(NamedTuple):
+    name: str
+    unit: str
+    description: str
+    run: Callable[["Context"], Measurement]
+
+
+class Context(NamedTuple):
+    root: Tk
+    style: Style
+    widgets: int
+    lines: int
+
+
+def _container(root: Tk) -> Frame:
+    container = Frame(root)
+    container.pack(fill="both", expand=True)
+    root.update()
+    return container
+
+
+def _destroy(root: Tk, container: Frame) -> None:
+    container.destroy()
+    root.update()
+    gc.collect()
+
+
+def _construct(
+    widget_class: Callable[..., ThemedText],
+    *,
+    pack: bool = True,
+    **kwargs: Any,
+) -> Callable[[Context], Measurement]:
+    def run(context: Context) -> Measurement:
+        container = _container(context.root)
+        start = perf_counter()
+        for _ in range(context.widgets):
+            widget = widget_class(container, height=2, **kwargs)
+            if pack:
+                widget.pack()
+        context.root.update_idletasks()
+        total = perf_counter() - start
+        _destroy(context.root, container)
+        return Measurement(total, context.widgets)
+
+    return run
+
+
+def bench_bind_widget(context: Context) -> Measurement:
+    container = _container(context.root)
+    text = ThemedText(container)
+    text.pack()
+    children = [Frame(text.frame) for _ in range(context.widgets)]
+    start = perf_counter()
+    for child in children:
+        text.frame.bind_widget(child)
+    total = perf_counter() - start
+    _destroy(context.root, container)
+    return Measurement(total, len(children))
+
+
+def bench_theme_switch(context: Context) -> Measurement:
+    container = _container(context.root)
+    for _ in range(context.widgets):
+        ThemedText(container, height=2).pack()
+    context.root.update()
+    themes = [theme for theme in ("clam", "alt", "default", "classic") if theme in context.style.theme_names()]
+    original = context.style.theme_use()
+    switches = 10
+    start = perf_counter()
+    for number in range(switches):
+        context.style.theme_use(themes[number % len(themes)])
+        context.root.update_idletasks()
+    total = perf_counter() - start
+    context.style.theme_use(original)
+    _destroy(context.root, container)
+    return Measurement(total, switches)
+
+
+def bench_state_transitions(context: Context) -> Measurement:
+    container = _container(context.root)
+    text = ThemedText(container)
+    text.pack()
+    context.root.update()
+    events = ("<Enter>", "<FocusIn>", "<ButtonPress-1>", "<ButtonRelease-1>", "<FocusOut>", "<Leave>")
+    rounds = 500
+    start = perf_counter()
+    for _ in range(rounds):
+        for sequence in events:
+            text.event_generate(sequence)
+        context.root.update_idletasks()
+    total = perf_counter() - start
+    _destroy(context.root, container)
+    return Measurement(total, rounds * len(events))
+
+
+def bench_insert(context: Context) -> Measurement:
+    container = _container(context.root)
+    text = ThemedText(container)
+    text.pack()
+    lines = [f"line {number} of the inserted text\n" for number in range(context.lines)]
+    start = perf_counter()
+    for line in lines:
+        text.insert("end", line)
+    context.root.update_idletasks()
+    total = perf_counter() - start
+    _destroy(context.root, container)
+    return Measurement(total, len(lines))
+
+
+def bench_insert_stream(context: Context) -> Measurement:
+    container = _container(context.root)
+    text = ThemedText(container)
+    text.pack()
+    lines = [f"line {number} of the inserted text\n" for number in range(context.lines)]
+    start = perf_counter()
+    stream = text.insert_stream("end", lines)
+    while not stream.finished:
+        context.root.update()
+    total = perf_counter() - start
+    _destroy(context.root, container)
+    return Measurement(total, len(lines))
+
+
+def bench_python_memory(context: Context) -> Measurement:
+    container = _container(context.root)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(context.widgets):
+        ThemedText(container, height=2).pack()
+    context.root.update_idletasks()
+    gc.collect()
+    total = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    _destroy(context.root, container)
+    return Measurement(total, context.widgets)
+
+
+def _resident_memory() -> Optional[int]:
+    statm = Path("/proc/self/statm")
+    if not statm.exists():
+        return None
+    return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def bench_resident_memory(context: Context) -> Measurement:
+    container = _container(context.root)
+    before = _resident_memory()
+    if before is None:
+        _destroy(context.root, container)
+        return Measurement(float("nan"), context.widgets)
+    for _ in range(context.widgets):
+        ThemedText(container, height=2).pack()
+    context.root.update()
+    total = (_resident_memory() or before) - before
+    _destroy(context.root, container)
+    return Measurement(total, context.widgets)
+
+
+def bench_tcl_commands(context: Context) -> Measurement:
+    def count(widget: Misc) -> int:
+        return len(widget.tk.splitlist(widget.tk.call("info", "commands")))
+
+    container = _container(context.root)
+    before = count(container)
+    for _ in range(context.widgets):
+        ThemedText(container, height=2).pack()
+    context.root.update_idletasks()
+    total = count(container) - before
+    _destroy(context.root, container)
+    return Measurement(total, context.widgets)
+
+
+BENCHMARKS = (
+    Benchmark("construct_themed_text", "s", "Create and lay out a ThemedText", _construct(ThemedText)),
+    Benchmark("construct_scrolled_text", "s", "Create and lay out a ScrolledText", _construct(ScrolledText)),
+    Benchmark(
+        "construct_lazy_themed_text",
+        "s",
+        "Create a lazy ThemedText that stays hidden",
+        _construct(ThemedText, pack=False, lazy=True),
+    ),
+    Benchmark("bind_widget", "s", "Bind a widget to a frame", bench_bind_widget),
+    Benchmark("theme_switch", "s", "Switch the theme with --widgets widgets and restyle them", bench_theme_switch),
+    Benchmark("state_transition", "s", "Handle a synthetic state transition event", bench_state_transitions),
+    Benchmark("insert_line", "s", "Insert a line with one insert call per line", bench_insert),
+    Benchmark("insert_stream_line", "s", "Insert a line through insert_stream", bench_insert_stream),
+    Benchmark("python_memory_per_widget", "bytes", "Python memory allocated per ThemedText", bench_python_memory),
+    Benchmark("resident_memory_per_widget", "bytes", "Resident memory per ThemedText", bench_resident_memory),
+    Benchmark("tcl_commands_per_widget", "commands", "Tcl commands created per ThemedText", bench_tcl_commands),
+)
+
+
+def run_benchmarks(context: Context, names: List[str], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for benchmark in BENCHMARKS:
+        if names and benchmark.name not in names:
+            continue
+        samples = []
+        for _ in range(repeat):
+            measurement = benchmark.run(context)
+            samples.append(measurement.total / measurement.operations)
+        results[benchmark.name] = {
+            "value": min(samples),
+            "unit": benchmark.unit,
+            "description": benchmark.description,
+            "samples": samples,
+        }
+        print(f"{benchmark.name:<28} {min(samples):>14.6g} {benchmark.unit}", file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return the names of the results that regressed by more than ``threshold`` against the baseline."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous["value"] or previous["value"] != previous["value"]:  # Missing, 0 or NaN
+            continue
+        ratio = result["value"] / previous["value"]
+        print(f"{name:<28} {ratio:>8.2f}x of baseline", file=sys.stderr)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").strip().split("\n", 1)[0])
+    parser.add_argument("benchmarks", nargs="*", help="Benchmarks to run, all by default")
+    parser.add_argument("--widgets", type=int, default=200, help="Number of widgets of multi-widget benchmarks")
+    parser.add_argument("--lines", type=int, default=20000, help="Number of lines of insert benchmarks")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each benchmark")
+    parser.add_argument("--theme", help="Theme used while benchmarking")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to a file instead of stdout")
+    parser.add_argument("--compare", type=Path, help="JSON report to compare the results with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.benchmarks).difference(benchmark.name for benchmark in BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    root = Tk()
+    root.geometry("800x600")
+    style = Style(root)
+    if args.theme:
+        style.theme_use(args.theme)
+    context = Context(root, style, args.widgets, args.lines)
+    try:
+        results = run_benchmarks(context, args.benchmarks, args.repeat)
+        report = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "tk": str(root.tk.call("info", "patchlevel")),
+            "windowing_system": root.tk.call("tk", "windowingsystem"),
+            "theme": style.theme_use(),
+            "parameters": {"widgets": args.widgets, "lines": args.lines, "repeat": args.repeat},
+            "results": results,
+        }
+    finally:
+        root.destroy()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,36 @@
+from collections import deque
+from time import perf_counter
 from tkinter import Event, EventType, Grid, Misc, Pack, Place, Text
-from tkinter.ttk import Frame, Style
-from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Optional
-from weakref import WeakKeyDictionary
-
-from ttk_text._utils import parse_padding
+from tkinter.ttk import Frame
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+from ttk_text import instrumentation
+from ttk_text._diff import TextPatcher
+from ttk_text._export import TextExport, export_steps, iter_chunks
+from ttk_text._journal import EditJournal, LineChange
+from ttk_text._paste import PasteHandler
+from ttk_text._scheduler import StyleUpdateScheduler, ThemeChangeCoordinator
+from ttk_text._sink import TextSink
+from ttk_text._stream import Chunk, InsertStream, Tags, insert_batch
+from ttk_text._style import StyleLookupCache
+from ttk_text._tags import Index, apply_tag_ranges, to_indices
+from ttk_text._utils import PendingTasks, parse_padding, unbind_funcid, widget_path
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
@@ -14,6 +41,11 @@ _UPDATE_STYLE_ONLY_EVENTS = ("<FocusIn>", "<FocusOut>", "<Enter>", "<Leave>")
 
 _TRANSITION_STATE_EVENTS = (*_UPDATE_STYLE_ONLY_EVENTS, "<ButtonPress-1>", "<ButtonRelease-1>")
 
+# Bind tags used when class bindings are enabled, the bindings are installed once per interpreter.
+_TRANSITION_STATE_BINDTAG = "ThemedTextFrameTransitionState"
+_UPDATE_STYLE_ONLY_BINDTAG = "ThemedTextFrameUpdateStyleOnly"
+_THEME_CHANGED_BINDTAG = "ThemedTextFrameThemeChanged"
+
 
 class BoundText(NamedTuple):
     """
@@ -45,7 +77,7 @@ class BoundWidget(NamedTuple):
     penetration_state: bool
 
 
-class ThemedTextFrame(Frame):
+class ThemedTextFrame(PendingTasks, Frame):
     """
     A themed text frame providing ttk-style text container.
 
@@ -90,16 +122,35 @@ class ThemedTextFrame(Frame):
             scrollbar.grid(row=0, column=1, sticky="ns")
             frame.bind_widget(scrollbar, penetration_state=False)
 
+    Lazy Realization:
+        With ``lazy=True``, the frame only records the bound widgets until it is first mapped. The event
+        bindings and the style are then applied on the first ``<Map>`` event, or by calling `realize`.
+        Frames that are never shown, e.g. in hidden notebook tabs, cost almost nothing.
+
     Style Options:
         - style: ttk style name (default="ThemedText.TEntry")
         - class_: Widget class name (default="ThemedText")
     """
 
-    def __init__(self, master: Optional[Misc] = None, **kwargs):
+    # Frames of widgets bound through bind tags, shared by the class binding dispatcher.
+    __class_bound_frames: "MutableMapping[Misc, ref[ThemedTextFrame]]" = WeakKeyDictionary()
+    __class_bound_roots: "WeakSet[Misc]" = WeakSet()
+
+    def __init__(
+        self,
+        master: Optional[Misc] = None,
+        *,
+        enable_class_bindings: bool = False,
+        lazy: bool = False,
+        **kwargs,
+    ):
         """
         Initialize a ThemedTextFrame instance.
 
         :param master: Parent widget, default is None
+        :param enable_class_bindings: Install the event handlers once per interpreter as bind tags,
+                                      instead of creating Tcl commands for every bound widget
+        :param lazy: Defer the event bindings and the style until the frame is first mapped
         :param kwargs: Configuration options passed to Frame
 
         .. note::
@@ -114,13 +165,121 @@ class ThemedTextFrame(Frame):
         if "takefocus" not in kwargs:
             kwargs["takefocus"] = False
         super().__init__(master, **kwargs)
-        self.__style = Style(self)
+        self.__style_cache = StyleLookupCache.of(self)
+        self.__theme_change_coordinator = ThemeChangeCoordinator.of(self)
+        self.__style_update_scheduler = StyleUpdateScheduler.of(self)
+        self.__style_name: str = self.cget("style")
+        self.__t_entry_foreground: Optional[Tuple[int, str]] = None
         self.__bound_text: Optional[BoundText] = None
         self.__bound_widgets: MutableMapping[Misc, BoundWidget] = WeakKeyDictionary()
-        self.__update_stateful_style_task_id: Optional[str] = None
+        # Bindings installed on each bound widget, as (sequence, funcid) pairs, so they can be removed exactly.
+        self.__widget_bindings: MutableMapping[Misc, List[Tuple[str, str]]] = WeakKeyDictionary()
+        self.__applied_frame_options: Dict[str, Any] = {}
+        self.__applied_text_options: Dict[str, Any] = {}
+        self.__applied_text_padding: Optional[Tuple[Any, Any]] = None
+        self.__skipped_configure_count = 0
+        self.__enable_class_bindings = enable_class_bindings
+        self.__realized = False
+        self.__pending_widgets: List[BoundWidget] = []
+        self.__pending_text: Optional[BoundText] = None
+        self.__map_funcid: Optional[str] = None
+        self.__destroyed = False
+
+        if lazy:
+            self.__map_funcid = self.bind("<Map>", self.__on_first_map, "+")
+        else:
+            self.realize()
 
+    @property
+    def realized(self) -> bool:
+        """Whether the event bindings and the style have been applied, see `realize`."""
+        return self.__realized
+
+    def realize(self) -> None:
+        """
+        Apply the event bindings and the style now, instead of on the first ``<Map>`` event of a lazy frame.
+
+        Widgets bound before are bound in the order they were recorded. Calling it again does nothing.
+        """
+        if self.__realized:
+            return
+        self.__realized = True
+        if self.__map_funcid is not None:
+            unbind_funcid(self, "<Map>", self.__map_funcid)
+            self.__map_funcid = None
+
+        self.__theme_change_coordinator.register(self)
+        if self.__enable_class_bindings:
+            self.__install_class_bindings()
         self.bind_widget(self, penetration_state=True)
-        self.bind("<<ThemeChanged>>", self.__on_theme_changed, "+")
+        if self.__enable_class_bindings:
+            self.__add_bindtag(self, _THEME_CHANGED_BINDTAG)
+        else:
+            self.bind("<<ThemeChanged>>", self.__on_theme_changed, "+")
+
+        pending_widgets, self.__pending_widgets = self.__pending_widgets, []
+        for bound_widget in pending_widgets:
+            if bound_widget.instance.winfo_exists():
+                self.bind_widget(bound_widget.instance, penetration_state=bound_widget.penetration_state)
+        if pending_text := self.__pending_text:
+            self.__pending_text = None
+            if pending_text.proxy.winfo_exists():
+                self.bind_text(
+                    pending_text.widget,
+                    pending_text.proxy,
+                    enable_inactive_select=pending_text.enable_inactive_select,
+                    enable_t_entry_database_compat=pending_text.enable_t_entry_database_compat,
+                )
+
+    def __on_first_map(self, event: Event) -> None:
+        if event.widget is self:
+            self.realize()
+
+    def destroy(self) -> None:
+        """
+        Destroy the frame and release everything it registered.
+
+        Pending style updates are dropped, bindings installed on widgets outside the frame are removed,
+        and pending ``after`` callbacks of the frame are cancelled before its Tcl commands are deleted.
+        """
+        if self.__destroyed:
+            return  # Destroying the bound ThemedText destroys its frame as well
+        self.__destroyed = True
+        self.__theme_change_coordinator.unregister(self)
+        self.__style_update_scheduler.discard(self)
+        self.__pending_widgets = []
+        self.__pending_text = None
+        # Bindings of descendants are deleted with them.
+        prefix = f"{self}."
+        for widget in list(self.__bound_widgets.keys()):
+            if widget is not self and not widget_path(widget).startswith(prefix):
+                self.unbind_widget(widget)
+        self.cancel_pending_tasks()
+        super().destroy()
+
+    def configure(self, cnf: Union[Dict[str, Any], str, None] = None, **kw: Any) -> Any:
+        result = super().configure(cnf, **kw)
+        if "style" in kw or (isinstance(cnf, dict) and "style" in cnf):
+            self.__style_name = super().cget("style")
+            self.update_style()
+        return result
+
+    config = configure
+
+    @property
+    def skipped_configure_count(self) -> int:
+        """Number of configure and grid calls skipped because the applied values did not change."""
+        return self.__skipped_configure_count
+
+    @property
+    def theme_change_coordinator(self) -> ThemeChangeCoordinator:
+        """The coordinator that re-styles all frames of the interpreter after a theme change."""
+        return self.__theme_change_coordinator
+
+    @property
+    def style_update_scheduler(self) -> StyleUpdateScheduler:
+        """The scheduler that flushes the stateful style updates of all frames of the interpreter."""
+        return self.__style_update_scheduler
 
     def bind_widget(self, widget: Misc, *, penetration_state: bool = False) -> None:
         """
@@ -139,19 +298,101 @@ class ThemedTextFrame(Frame):
             Since the frame automatically updates its own state, all internal components
             need to be event-bound to ensure styles are correctly updated to the text widget.
             This is the main purpose of penetration_state=False.
+
+            Binding a widget again is idempotent, with another ``penetration_state`` it replaces the
+            previous bindings.
         """
         if not widget.winfo_exists():
             raise ValueError("Widget does not exist")
-        self.__bound_widgets[widget] = BoundWidget(widget, penetration_state)
+        bound_widget = BoundWidget(widget, penetration_state)
+        if not self.__realized:
+            self.__pending_widgets = [pending for pending in self.__pending_widgets if pending.instance is not widget]
+            self.__pending_widgets.append(bound_widget)
+            return
+        if self.__bound_widgets.get(widget) == bound_widget:
+            return
+        self.unbind_widget(widget)
+        self.__bound_widgets[widget] = bound_widget
+
+        if self.__enable_class_bindings:
+            ThemedTextFrame.__class_bound_frames[widget] = ref(self)
+            self.__add_bindtag(widget, _TRANSITION_STATE_BINDTAG if penetration_state else _UPDATE_STYLE_ONLY_BINDTAG)
+            return
 
         if penetration_state:
-            for sequence in _TRANSITION_STATE_EVENTS:
-                widget.bind(sequence, self.__handle_state_transition, "+")
+            sequences, handler = _TRANSITION_STATE_EVENTS, self.__handle_state_transition
         else:
-            for sequence in _UPDATE_STYLE_ONLY_EVENTS:
-                widget.bind(sequence, self.__handle_style_update, "+")
+            sequences, handler = _UPDATE_STYLE_ONLY_EVENTS, self.__handle_style_update
+        bindings = [(sequence, widget.bind(sequence, handler, "+")) for sequence in sequences]
+        bindings.append(("<Destroy>", widget.bind("<Destroy>", self.__on_bound_widget_destroy, "+")))
+        self.__widget_bindings[widget] = bindings
+
+    def unbind_widget(self, widget: Misc) -> None:
+        """
+        Remove the bindings installed by `bind_widget`, other bindings of the widget are kept.
+
+        The Tcl commands of the removed bindings are deleted. Unbinding a widget that is not bound does nothing.
 
-        widget.bind("<Destroy>", self.__on_bound_widget_destroy, "+")
+        :param widget: Widget instance to unbind
+        """
+        self.__pending_widgets = [pending for pending in self.__pending_widgets if pending.instance is not widget]
+        if self.__bound_widgets.pop(widget, None) is None:
+            return
+        if self.__enable_class_bindings:
+            ThemedTextFrame.__class_bound_frames.pop(widget, None)
+            self.__remove_bindtags(widget)
+            return
+        bindings = self.__widget_bindings.pop(widget, ())
+        if widget.winfo_exists():
+            for sequence, funcid in bindings:
+                unbind_funcid(widget, sequence, funcid)
+
+    def __install_class_bindings(self) -> None:
+        root = self.nametowidget(".")
+        if root in ThemedTextFrame.__class_bound_roots:
+            return
+        dispatch = ThemedTextFrame.__dispatch_class_event
+        for sequence in _TRANSITION_STATE_EVENTS:
+            self.bind_class(_TRANSITION_STATE_BINDTAG, sequence, dispatch)
+        for sequence in _UPDATE_STYLE_ONLY_EVENTS:
+            self.bind_class(_UPDATE_STYLE_ONLY_BINDTAG, sequence, dispatch)
+        self.bind_class(_TRANSITION_STATE_BINDTAG, "<Destroy>", dispatch)
+        self.bind_class(_UPDATE_STYLE_ONLY_BINDTAG, "<Destroy>", dispatch)
+        self.bind_class(_THEME_CHANGED_BINDTAG, "<<ThemeChanged>>", dispatch)
+        ThemedTextFrame.__class_bound_roots.add(root)
+
+    @staticmethod
+    def __add_bindtag(widget: Misc, tag: str) -> None:
+        tags = widget.bindtags()
+        if tag not in tags:
+            # Run right after the widget's own bindings, like bindings added with "+" would.
+            widget.bindtags((tags[0], tag, *tags[1:]))
+
+    @staticmethod
+    def __remove_bindtags(widget: Misc) -> None:
+        if not widget.winfo_exists():
+            return
+        tags = widget.bindtags()
+        removed = (_TRANSITION_STATE_BINDTAG, _UPDATE_STYLE_ONLY_BINDTAG)
+        if any(tag in tags for tag in removed):
+            widget.bindtags(tuple(tag for tag in tags if tag not in removed))
+
+    @classmethod
+    def __dispatch_class_event(cls, event: Event) -> None:
+        if not isinstance(event.widget, Misc):
+            return
+        frame_ref = cls.__class_bound_frames.get(event.widget)
+        frame = frame_ref() if frame_ref else None
+        if frame is None:
+            return
+        # The handlers are looked up on the class, as they run for another instance than the dispatcher's.
+        if event.type == EventType.Destroy:
+            del cls.__class_bound_frames[event.widget]
+            ThemedTextFrame.__on_bound_widget_destroy(frame, event)
+        elif event.type == EventType.VirtualEvent:
+            ThemedTextFrame.__on_theme_changed(frame, event)
+        else:
+            ThemedTextFrame.__handle_state_transition(frame, event)
 
     def bind_text(
         self,
@@ -177,23 +418,49 @@ class ThemedTextFrame(Frame):
             proxy = text
         if not proxy.winfo_exists():
             raise ValueError(f"Text widget {proxy} does not exist or has been destroyed")
-        self.__bound_text = BoundText(
+        bound_text = BoundText(
             text,
             proxy,
             enable_inactive_select=enable_inactive_select,
             enable_t_entry_database_compat=enable_t_entry_database_compat,
         )
+        if not self.__realized:
+            self.__pending_text = bound_text
+            return
+        if self.__bound_text and self.__bound_text.widget is not text:
+            self.unbind_text()
+        self.__bound_text = bound_text
         proxy.configure(
             relief="flat",
             borderwidth=0,
             highlightthickness=0,
         )
+        self.__applied_text_options = {}
+        self.__applied_text_padding = None
         self.bind_widget(text, penetration_state=True)
         self.update_style()
 
+    def unbind_text(self) -> None:
+        """
+        Detach the bound text widget, the counterpart of `bind_text`.
+
+        Its event bindings are removed, and the frame no longer applies the style to it.
+        """
+        self.__pending_text = None
+        if bound_text := self.__bound_text:
+            self.__bound_text = None
+            self.unbind_widget(bound_text.widget)
+            self.__applied_text_options = {}
+            self.__applied_text_padding = None
+
     def __on_bound_widget_destroy(self, event: Event):
+        if event.widget is self:
+            self.__theme_change_coordinator.unregister(self)
+            self.__style_update_scheduler.discard(self)
+
         if event.widget in self.__bound_widgets:
             del self.__bound_widgets[event.widget]
+            self.__widget_bindings.pop(event.widget, None)
 
         if self.__bound_text and event.widget is self.__bound_text.widget:
             self.__bound_text = None
@@ -226,55 +493,140 @@ class ThemedTextFrame(Frame):
         if event.widget != self:
             return
         # Prevents style updates after widget destruction.
-        self.update_style()
+        # All frames are updated together once every frame has received the event.
+        self.__theme_change_coordinator.schedule()
 
-    def __lookup(self, option: str, *, state: Optional[Iterable[str]] = None, default: Any = None) -> Any:
-        result = self.__style.lookup(self.cget("style"), option, state)
+    def lookup(
+        self,
+        option: str,
+        *,
+        state: Optional[Iterable[str]] = None,
+        default: Any = None,
+        substyle: Optional[str] = None,
+    ) -> Any:
+        """
+        Look up an option of the frame style, through the lookup cache shared by the interpreter.
+
+        :param option: Option name without the leading dash
+        :param state: State specification to look up the value for
+        :param default: Value returned if the option is not set
+        :param substyle: Prefix of a derived style, e.g. "Keyword" looks up "Keyword.ThemedText.TEntry",
+                         which falls back to the frame style for the options it does not set
+        :return: The option value
+        """
+        style = f"{substyle}.{self.__style_name}" if substyle else self.__style_name
+        result = self.__style_cache.lookup(style, option, state)
         if not result:  # Avoid ""
             return default
         return result
 
+    def __lookup(self, option: str, *, state: Optional[Iterable[str]] = None, default: Any = None) -> Any:
+        return self.lookup(option, state=state, default=default)
+
+    def __option_get_t_entry_foreground(self) -> str:
+        # The option database is shared by the interpreter, so the cache generation also covers it.
+        generation = self.__style_cache.generation
+        if self.__t_entry_foreground is None or self.__t_entry_foreground[0] != generation:
+            self.__t_entry_foreground = (generation, self.option_get("foreground", "TEntry"))
+        return self.__t_entry_foreground[1]
+
     def update_style(self) -> None:
+        if not self.__realized:
+            return  # Applied on realization
+        timed = instrumentation.enabled
+        start = perf_counter() if timed else 0.0
         if bound_text := self.__bound_text:
-            proxy = bound_text.proxy
-            proxy.configure(
-                selectbackground=self.__lookup("selectbackground", state=["focus"]),
-                insertwidth=self.__lookup("insertwidth", state=["focus"], default=1),
-                font=self.__lookup("font", default="TkDefaultFont"),
-            )
+            options = {
+                "selectbackground": self.__lookup("selectbackground", state=["focus"]),
+                "insertwidth": self.__lookup("insertwidth", state=["focus"], default=1),
+                "font": self.__lookup("font", default="TkDefaultFont"),
+            }
             if bound_text.enable_inactive_select:
-                proxy.configure(inactiveselectbackground=self.__lookup("selectbackground"))
+                options["inactiveselectbackground"] = self.__lookup("selectbackground")
+            self.__configure_text(**options)
 
             if text_padding := parse_padding(self.__lookup("textpadding")):
-                proxy.grid(padx=text_padding.to_padx(), pady=text_padding.to_pady())
+                self.__grid_text(text_padding.to_padx(), text_padding.to_pady())
             else:
-                proxy.grid(padx=0, pady=0)
-        self.configure(
+                self.__grid_text(0, 0)
+        self.__configure_frame(
             padding=self.__lookup("padding", default="1"),
             borderwidth=self.__lookup("borderwidth", default="1"),
         )
         self.__update_stateful_style()
+        if timed:
+            instrumentation.record("update_style", start, self)
+
+    @staticmethod
+    def __diff_options(applied: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+        # None is skipped by configure, so it never counts as a change.
+        return {key: value for key, value in options.items() if value is not None and applied.get(key) != value}
+
+    def __configure_text(self, **options) -> None:
+        """Configure the bound text with the options that differ from the last applied values."""
+        if bound_text := self.__bound_text:
+            changed = self.__diff_options(self.__applied_text_options, options)
+            if not changed:
+                self.__skip_configure()
+                return
+            timed = instrumentation.enabled
+            start = perf_counter() if timed else 0.0
+            bound_text.proxy.configure(**changed)
+            self.__applied_text_options.update(changed)
+            if timed:
+                instrumentation.record("configure", start, self)
+
+    def __grid_text(self, padx: Any, pady: Any) -> None:
+        """Apply the text padding only when it changed, as it forces the geometry to be recomputed."""
+        if bound_text := self.__bound_text:
+            if self.__applied_text_padding == (padx, pady):
+                self.__skip_configure()
+                return
+            timed = instrumentation.enabled
+            start = perf_counter() if timed else 0.0
+            bound_text.proxy.grid(padx=padx, pady=pady)
+            self.__applied_text_padding = (padx, pady)
+            if timed:
+                instrumentation.record("configure", start, self)
+
+    def __configure_frame(self, **options) -> None:
+        changed = self.__diff_options(self.__applied_frame_options, options)
+        if not changed:
+            self.__skip_configure()
+            return
+        timed = instrumentation.enabled
+        start = perf_counter() if timed else 0.0
+        self.configure(**changed)
+        self.__applied_frame_options.update(changed)
+        if timed:
+            instrumentation.record("configure", start, self)
+
+    def __skip_configure(self) -> None:
+        self.__skipped_configure_count += 1
+        if instrumentation.enabled:
+            instrumentation.count("configure_skipped", self)
 
     def __update_stateful_style_debounce(self):
-        if self.__update_stateful_style_task_id is not None:
-            self.after_cancel(self.__update_stateful_style_task_id)
-        self.__update_stateful_style_task_id = self.after_idle(self.__update_stateful_style)
+        if not self.__style_update_scheduler.mark_dirty(self, self.__update_stateful_style) and instrumentation.enabled:
+            instrumentation.count("style_update_merged", self)
 
     def __update_stateful_style(self):
-        if self.__update_stateful_style_task_id is not None:
-            self.after_cancel(self.__update_stateful_style_task_id)
-            self.__update_stateful_style_task_id = None
+        self.__style_update_scheduler.discard(self)
         if self.__bound_text:
-            state = self.state()
-            self.__bound_text.proxy.configure(
-                background=self.__lookup("fieldbackground", state=state),
-                foreground=self.option_get("foreground", "TEntry")  # Compatible with tk_setPalette
-                or self.__lookup("foreground", state=state),
-                selectforeground=self.__lookup("selectforeground", state=state),
+            timed = instrumentation.enabled
+            start = perf_counter() if timed else 0.0
+            appearance = self.__style_cache.appearance(self.__style_name, self.state())
+            self.__configure_text(
+                background=appearance.background,
+                foreground=self.__option_get_t_entry_foreground()  # Compatible with tk_setPalette
+                or appearance.foreground,
+                selectforeground=appearance.selectforeground,
             )
+            if timed:
+                instrumentation.record("stateful_style_update", start, self)
 
 
-class ThemedText(Text):
+class ThemedText(PendingTasks, Text):
     """
     A themed text widget combining Tkinter Text with ttk Frame styling.
 
@@ -299,6 +651,10 @@ class ThemedText(Text):
         native Text widget functionality. Use standard geometry managers as with
         regular ttk widgets.
 
+    Lazy Realization:
+        With ``lazy=True``, the style and the event bindings are applied when the widget is first
+        mapped (see ThemedTextFrame), so widgets that are never shown are cheap to create.
+
     Inheritance Chain:
         ThemedText → tkinter.Text → tkinter.Widget → tkinter.BaseWidget → object
     """
@@ -309,6 +665,8 @@ class ThemedText(Text):
         *,
         enable_inactive_select: bool = True,
         enable_t_entry_database_compat: bool = True,
+        enable_class_bindings: bool = False,
+        lazy: bool = False,
         **kwargs,
     ):
         """
@@ -319,6 +677,8 @@ class ThemedText(Text):
         :param class_: Widget class name (default='ThemedText')
         :param enable_inactive_select: Display selection when the widget is inactive
         :param enable_t_entry_database_compat: Compatibility with tk_setPalette
+        :param enable_class_bindings: Install the frame event handlers as shared bind tags (see ThemedTextFrame)
+        :param lazy: Apply the style and the event bindings when the widget is first mapped
         :param kwargs: Additional Text widget configuration options
 
         .. note::
@@ -333,11 +693,13 @@ class ThemedText(Text):
             "borderwidth": kwargs.pop("borderwidth", None),
         }
 
-        self.frame = ThemedTextFrame(master, **frame_kwargs)
+        self.__edit_journal: Optional[EditJournal] = None
+        self.__patcher: Optional[TextPatcher] = None
+        self.frame = ThemedTextFrame(master, enable_class_bindings=enable_class_bindings, lazy=lazy, **frame_kwargs)
         super().__init__(self.frame, **kwargs)
         self.frame.grid_columnconfigure(1, weight=1)
         self.frame.grid_rowconfigure(1, weight=1)
-        self.grid(row=1, column=1, sticky="nsew")
+        super().grid(row=1, column=1, sticky="nsew")
 
         # Use super() as a proxy to ensure direct calls to Text base class methods
         # Bypass methods that may be overridden in ThemedText (e.g., grid/configure)
@@ -347,17 +709,330 @@ class ThemedText(Text):
             enable_inactive_select=enable_inactive_select,
             enable_t_entry_database_compat=enable_t_entry_database_compat,
         )
-        self.__copy_geometry_methods()
 
     def text_proxy(self) -> Text:
         """Return the proxy of internal Text widget object."""
-        return super()
+        return cast("Text", super())
+
+    def destroy(self) -> None:
+        """
+        Destroy the text widget together with its frame.
+
+        Pending ``after`` callbacks of the text, such as those of streams and sinks, are cancelled
+        before its Tcl commands are deleted.
+        """
+        if self.__edit_journal is not None:
+            self.__edit_journal.close()
+        self.cancel_pending_tasks()
+        super().destroy()
+        self.frame.destroy()
+
+    @property
+    def edit_journal(self) -> EditJournal:
+        """
+        The journal of changed lines, created on first access.
+
+        From then on, every edit including those made by Tk bindings is recorded, so consumers can
+        react to the changed lines instead of reading and comparing the whole text.
+
+        Example:
+            .. code-block:: python
+
+                def on_change(change: LineChange):
+                    print(f"Lines {change.first}-{change.old_last} became {change.first}-{change.new_last}")
+
+
+                text.edit_journal.subscribe(on_change)
+        """
+        if self.__edit_journal is None:
+            self.__edit_journal = EditJournal(self)
+        return self.__edit_journal
+
+    def subscribe_changes(self, callback: Callable[[LineChange], None]) -> None:
+        """Call a function once per idle cycle with each merged `LineChange` of the edited lines."""
+        self.edit_journal.subscribe(callback)
+
+    def unsubscribe_changes(self, callback: Callable[[LineChange], None]) -> None:
+        self.edit_journal.unsubscribe(callback)
+
+    def set_text(self, chars: str, *, on_done: Optional[Callable[[], None]] = None) -> None:
+        """
+        Replace the content, applying only the inserts and deletes of the changed lines.
+
+        Unlike deleting and inserting everything, the view, the tags and marks of unchanged lines and the
+        undo stack are preserved, and the replacement is a single undo step. Large contents are diffed in
+        a worker thread, the changes are then applied by the event loop; a later call supersedes it.
 
-    def __copy_geometry_methods(self):
-        """Copy geometry methods of self.frame without overriding Text methods."""
-        for m in (vars(Pack).keys() | vars(Grid).keys() | vars(Place).keys()).difference(vars(Text).keys()):
-            if m[0] != "_" and m not in {"config", "configure"}:
-                setattr(self, m, getattr(self.frame, m))
+        :param chars: New content
+        :param on_done: Called once the content is replaced, which may be before this method returns
+
+        Example:
+            .. code-block:: python
+
+                text.set_text(render_report(model))
+        """
+        if self.__patcher is None:
+            self.__patcher = TextPatcher(self)
+        self.__patcher.set_text(chars, on_done)
+
+    def enable_chunked_paste(
+        self,
+        *,
+        threshold: int = 256 * 1024,
+        time_budget: float = 0.008,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> PasteHandler:
+        """
+        Paste large clipboard contents without blocking the event loop.
+
+        Pastes of at least ``threshold`` characters are inserted at the insert cursor in time-sliced
+        chunks, as a single undo step. Smaller pastes, and pastes into a disabled text, keep the native
+        ``<<Paste>>`` binding.
+
+        :param threshold: Size in characters from which pastes are chunked
+        :param time_budget: Time in seconds each slice may spend inserting
+        :param on_progress: Called after each slice with the inserted and total number of characters
+        :param on_done: Called once per chunked paste, with True when completed and False when cancelled
+        :return: The handler, whose ``remove`` method restores the native paste
+
+        Example:
+            .. code-block:: python
+
+                text.enable_chunked_paste(on_progress=lambda done, total: status.set(f"{done * 100 // total}%"))
+        """
+        return PasteHandler(
+            self,
+            threshold=threshold,
+            time_budget=time_budget,
+            on_progress=on_progress,
+            on_done=on_done,
+        )
+
+    def insert_stream(
+        self,
+        index: str,
+        chunks: Iterable[Chunk],
+        tags: Tags = (),
+        *,
+        time_budget: float = 0.008,
+        on_progress: Optional[Callable[[int], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> InsertStream:
+        """
+        Insert an iterable or generator of strings without blocking the event loop.
+
+        The chunks are inserted in batches spread over event loop slices of ``time_budget`` seconds.
+
+        :param index: Index where the chunks are inserted
+        :param chunks: Strings, or ``(string, tags)`` tuples
+        :param tags: Tags of plain string chunks
+        :param time_budget: Time in seconds each slice may spend inserting
+        :param on_progress: Called after each slice with the number of inserted characters
+        :param on_done: Called once with True when all chunks are inserted, False when cancelled
+        :return: The stream, which can be cancelled
+
+        Example:
+            .. code-block:: python
+
+                file = open("large.log", encoding="utf-8")
+                stream = text.insert_stream("end", file, on_done=lambda _: file.close())
+        """
+        return InsertStream(
+            self,
+            index,
+            chunks,
+            tags,
+            time_budget=time_budget,
+            on_progress=on_progress,
+            on_done=on_done,
+        )
+
+    def open_sink(self, tags: Tags = (), *, max_buffered: int = 1024 * 1024, time_budget: float = 0.008) -> TextSink:
+        """
+        Open a thread-safe, file-like sink that background threads can write to.
+
+        The sink must be opened on the thread running the Tk main loop, written text is appended
+        at the end by the main loop.
+
+        :param tags: Tags of the written text
+        :param max_buffered: Number of buffered characters above which writes block (backpressure)
+        :param time_budget: Time in seconds each drain slice may spend inserting
+        :return: The sink
+
+        Example:
+            .. code-block:: python
+
+                sink = text.open_sink()
+                threading.Thread(target=lambda: print("Hello from a thread", file=sink)).start()
+        """
+        return TextSink(self, self._insert_sink_batch, tags=tags, max_buffered=max_buffered, time_budget=time_budget)
+
+    def iter_chunks(self, start: str = "1.0", end: str = "end-1c", *, lines: int = 1024) -> Iterator[str]:
+        """
+        Yield the content of a range in chunks of lines, without building one string of the whole range.
+
+        :param start: Start index
+        :param end: End index
+        :param lines: Maximum number of lines per chunk
+        """
+        return iter_chunks(self, self.index(start), self.index(end), lines)
+
+    def export(
+        self,
+        file: IO[Any],
+        start: str = "1.0",
+        end: str = "end-1c",
+        *,
+        encoding: Optional[str] = None,
+        errors: str = "strict",
+        dump_file: Optional[IO[Any]] = None,
+        lines: int = 1024,
+    ) -> int:
+        """
+        Write a range to a file chunk by chunk, peak memory is bounded by the chunk size.
+
+        :param file: File object, opened in binary mode if ``encoding`` is given, in text mode otherwise
+        :param start: Start index
+        :param end: End index
+        :param encoding: Encoding of the written text, None to write strings
+        :param errors: Error handling scheme of the encoding
+        :param dump_file: File receiving the tags and marks of the range as ``key<TAB>value<TAB>index`` lines,
+                          key being "tagon", "tagoff" or "mark", opened in the same mode as ``file``
+        :param lines: Maximum number of lines per chunk
+        :return: Number of written characters
+
+        Example:
+            .. code-block:: python
+
+                with open("output.txt", "wb") as file:
+                    text.export(file, encoding="utf-8")
+        """
+        steps = export_steps(
+            self,
+            file,
+            self.index(start),
+            self.index(end),
+            encoding=encoding,
+            errors=errors,
+            dump_file=dump_file,
+            lines=lines,
+        )
+        # Run every step, only the count of the last one is kept.
+        last = deque(steps, maxlen=1)
+        return last[0] if last else 0
+
+    def export_stream(
+        self,
+        file: IO[Any],
+        start: str = "1.0",
+        end: str = "end-1c",
+        *,
+        encoding: Optional[str] = None,
+        errors: str = "strict",
+        dump_file: Optional[IO[Any]] = None,
+        lines: int = 1024,
+        time_budget: float = 0.008,
+        on_progress: Optional[Callable[[int], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> TextExport:
+        """
+        Write a range to a file like `export`, spread over event loop slices of ``time_budget`` seconds.
+
+        :param on_progress: Called after each slice with the number of written characters
+        :param on_done: Called once with True when the whole range is written, False when cancelled
+        :return: The export, which can be cancelled
+
+        Example:
+            .. code-block:: python
+
+                file = open("output.txt", "w", encoding="utf-8")
+                export = text.export_stream(file, on_done=lambda _: file.close())
+        """
+        steps = export_steps(
+            self,
+            file,
+            self.index(start),
+            self.index(end),
+            encoding=encoding,
+            errors=errors,
+            dump_file=dump_file,
+            lines=lines,
+        )
+        return TextExport(self, steps, time_budget=time_budget, on_progress=on_progress, on_done=on_done)
+
+    def tag_add_spans(self, spans: Iterable[Tuple[str, Index, Index]], *, base: str = "1.0") -> None:
+        """
+        Add many tag ranges at once, with a single Tcl call for all tags.
+
+        :param spans: (tag, start, end) tuples, integer indices are character offsets from ``base``
+        :param base: Index that integer offsets are relative to
+        """
+        self.__apply_spans("add", spans, base)
+
+    def tag_remove_spans(self, spans: Iterable[Tuple[str, Index, Index]], *, base: str = "1.0") -> None:
+        """Remove many tag ranges at once, the counterpart of `tag_add_spans`."""
+        self.__apply_spans("remove", spans, base)
+
+    def tag_add_ranges(
+        self,
+        tag: str,
+        starts: Iterable[Index],
+        ends: Optional[Iterable[Index]] = None,
+        *,
+        base: str = "1.0",
+    ) -> None:
+        """
+        Add many ranges of a tag at once, with a single Tcl call.
+
+        Indices may be given as parallel sequences, or as a single flat sequence of start and end indices.
+        Sequences can be lists, ``array.array`` or NumPy arrays of character offsets from ``base``.
+
+        :param tag: Tag name
+        :param starts: Start indices, or alternating start and end indices if ``ends`` is None
+        :param ends: End indices
+        :param base: Index that integer offsets are relative to
+
+        Example:
+            .. code-block:: python
+
+                # Highlight the characters 0-5 and 10-15 of the text
+                text.tag_add_ranges("match", array("l", [0, 10]), array("l", [5, 15]))
+        """
+        apply_tag_ranges(self, "add", {tag: self.__range_indices(starts, ends, base)})
+
+    def tag_remove_ranges(
+        self,
+        tag: str,
+        starts: Iterable[Index],
+        ends: Optional[Iterable[Index]] = None,
+        *,
+        base: str = "1.0",
+    ) -> None:
+        """Remove many ranges of a tag at once, the counterpart of `tag_add_ranges`."""
+        apply_tag_ranges(self, "remove", {tag: self.__range_indices(starts, ends, base)})
+
+    def __range_indices(self, starts: Iterable[Index], ends: Optional[Iterable[Index]], base: str) -> Sequence[str]:
+        if ends is None:
+            return to_indices(self, starts, base)
+        start_indices = to_indices(self, starts, base)
+        end_indices = to_indices(self, ends, base)
+        flat: List[str] = [""] * (len(start_indices) * 2)
+        flat[::2] = start_indices
+        flat[1::2] = end_indices
+        return flat
+
+    def __apply_spans(self, operation: str, spans: Iterable[Tuple[str, Index, Index]], base: str) -> None:
+        span_list = list(spans)
+        indices = iter(to_indices(self, (index for span in span_list for index in span[1:]), base))
+        by_tag: Dict[str, List[str]] = {}
+        for tag, _, _ in span_list:
+            by_tag.setdefault(tag, []).extend((next(indices), next(indices)))
+        apply_tag_ranges(self, operation, by_tag)
+
+    def _insert_sink_batch(self, args: List[Union[str, Tags]]) -> None:
+        """Insert a batch of text written to a sink, as alternating strings and tags."""
+        insert_batch(self, "end", args)
 
     def __str__(self):
         """
@@ -368,6 +1043,31 @@ class ThemedText(Text):
         return str(self.frame)
 
 
+def _forward_to_frame(name: str) -> Callable[..., Any]:
+    def method(self: ThemedText, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.frame, name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"ThemedText.{name}"
+    method.__doc__ = getattr(Frame, name).__doc__
+    return method
+
+
+def _forward_geometry_methods() -> None:
+    """
+    Forward the geometry methods of the frame from the ThemedText class, without overriding Text methods.
+
+    They are set once on the class, instead of being copied onto every instance.
+    """
+    names = (vars(Pack).keys() | vars(Grid).keys() | vars(Place).keys()).difference(vars(Text).keys())
+    for name in names:
+        if name[0] != "_" and name not in {"config", "configure"}:
+            setattr(ThemedText, name, _forward_to_frame(name))
+
+
+_forward_geometry_methods()
+
+
 def example():
     from tkinter import Tk
 
@@ -0,0 +1,53 @@
+from tkinter.ttk import Scrollbar
+from typing import Any
+
+
+class AutoScrollbar:
+    """
+    Visibility of a scrollbar that is shown only when the view does not cover the whole content.
+
+    The scroll command only records whether the scrollbar is wanted, the owner applies it later with
+    `apply` in numbered layout passes. Showing or hiding a scrollbar changes the size of the view, which
+    can in turn change whether it is wanted. A hide requested in the pass right after the scrollbar was
+    shown is deferred to the next pass, so the visibility changes at most once per two passes while the
+    geometry settles.
+
+    :ivar visible: Whether the scrollbar is shown
+    :ivar wanted: Whether the latest fractions need the scrollbar
+    """
+
+    def __init__(self, scrollbar: Scrollbar):
+        self.scrollbar = scrollbar
+        self.visible = False
+        self.wanted = False
+        self.__changed_generation = -2
+        scrollbar.grid_remove()
+
+    @property
+    def pending(self) -> bool:
+        """Whether the visibility differs from the wanted one."""
+        return self.wanted != self.visible
+
+    def set(self, first: Any, last: Any) -> None:
+        """Scroll command of the text, forwards the fractions to the scrollbar."""
+        self.scrollbar.set(first, last)
+        self.wanted = float(first) > 0.0 or float(last) < 1.0
+
+    def apply(self, generation: int) -> bool:
+        """
+        Show or hide the scrollbar as wanted, return whether its visibility changed.
+
+        :param generation: Number of the layout pass, a hide requested in the pass following the one that
+            showed the scrollbar is left pending
+        """
+        if not self.pending:
+            return False
+        if not self.wanted and generation == self.__changed_generation + 1:
+            return False
+        self.visible = self.wanted
+        self.__changed_generation = generation
+        if self.visible:
+            self.scrollbar.grid()
+        else:
+            self.scrollbar.grid_remove()
+        return True
@@ -0,0 +1,153 @@
+from difflib import SequenceMatcher
+from queue import Empty, SimpleQueue
+from threading import Thread
+from tkinter import Text
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# A changed range of lines: old start, old end, new start and new end, 0-based with exclusive ends.
+Opcode = Tuple[int, int, int, int]
+
+# Inputs with more lines than this, old and new together, are diffed in a worker thread.
+_THREAD_THRESHOLD = 10000
+_POLL_INTERVAL = 10
+_VIEW_MARK = "ttk_text_set_text_view"
+
+
+def line_opcodes(old: Sequence[str], new: Sequence[str]) -> List[Opcode]:
+    """
+    Return the changed line ranges turning ``old`` into ``new``.
+
+    The common prefix and suffix are skipped first, so small changes in large texts are cheap.
+    """
+    end = min(len(old), len(new))
+    prefix = 0
+    while prefix < end and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < end - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    old_end, new_end = len(old) - suffix, len(new) - suffix
+    if prefix == old_end and prefix == new_end:
+        return []
+    if prefix in (old_end, new_end):
+        return [(prefix, old_end, prefix, new_end)]
+    matcher = SequenceMatcher(None, old[prefix:old_end], new[prefix:new_end], autojunk=False)
+    return [
+        (prefix + i1, prefix + i2, prefix + j1, prefix + j2)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_line_opcodes(text: Text, opcodes: Sequence[Opcode], new: Sequence[str], old_line_count: int) -> None:
+    """
+    Apply changed line ranges to a text widget, from the bottom so earlier ranges keep their line numbers.
+
+    The last line has no newline of its own, it is ended by the final newline of the text widget.
+    """
+    for i1, i2, j1, j2 in reversed(opcodes):
+        if i2 < old_line_count:
+            if i1 < i2:
+                text.delete(f"{i1 + 1}.0", f"{i2 + 1}.0")
+            if j1 < j2:
+                text.insert(f"{i1 + 1}.0", "".join(f"{line}\n" for line in new[j1:j2]))
+        elif j1 == j2:
+            # Delete the trailing lines together with the newline before them.
+            text.delete(f"{i1}.end" if i1 > 0 else "1.0", "end-1c")
+        elif i1 == i2:
+            text.insert("end-1c", "\n" + "\n".join(new[j1:j2]))
+        else:
+            text.delete(f"{i1 + 1}.0", "end-1c")
+            text.insert(f"{i1 + 1}.0", "\n".join(new[j1:j2]))
+
+
+class TextPatcher:
+    """
+    Replace the content of a text widget by patching only the changed lines.
+
+    Lines are diffed against the current content, in a worker thread for large inputs. The changes are
+    applied as a single undo step, and the view is kept on the same line. Unchanged lines keep their
+    tags and marks.
+    """
+
+    def __init__(self, text: Text):
+        self.__text = text
+        self.__results: SimpleQueue[Tuple[int, List[Opcode]]] = SimpleQueue()
+        self.__generation = 0
+        self.__pending: Optional[Tuple[str, str, Optional[Callable[[], None]]]] = None
+        self.__poll_task_id: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self.__pending is not None
+
+    def set_text(self, chars: str, on_done: Optional[Callable[[], None]] = None) -> None:
+        """
+        Replace the content, superseding a replacement in progress.
+
+        :param chars: New content
+        :param on_done: Called once the content is replaced
+        """
+        self.__generation += 1
+        snapshot = self.__text.get("1.0", "end-1c")
+        old, new = snapshot.split("\n"), chars.split("\n")
+        if len(old) + len(new) < _THREAD_THRESHOLD:
+            self.__pending = None
+            self.__apply(line_opcodes(old, new), new, len(old))
+            if on_done is not None:
+                on_done()
+            return
+        self.__pending = (snapshot, chars, on_done)
+        Thread(target=self.__diff, args=(self.__generation, old, new), daemon=True).start()
+        if self.__poll_task_id is None:
+            self.__poll_task_id = self.__text.after(_POLL_INTERVAL, self.__poll)
+
+    def __diff(self, generation: int, old: List[str], new: List[str]) -> None:
+        """Run in the worker thread, the result is sent to the main thread through the queue."""
+        self.__results.put((generation, line_opcodes(old, new)))
+
+    def __poll(self) -> None:
+        self.__poll_task_id = None
+        result = None
+        while True:
+            try:
+                generation, opcodes = self.__results.get_nowait()
+            except Empty:
+                break
+            if generation == self.__generation:
+                result = opcodes
+        if self.__pending is None:
+            return
+        if result is None:
+            self.__poll_task_id = self.__text.after(_POLL_INTERVAL, self.__poll)
+            return
+        snapshot, chars, on_done = self.__pending
+        if self.__text.get("1.0", "end-1c") != snapshot:
+            # The text was edited while diffing, diff against the current content again.
+            self.set_text(chars, on_done)
+            return
+        self.__pending = None
+        new = chars.split("\n")
+        self.__apply(result, new, snapshot.count("\n") + 1)
+        if on_done is not None:
+            on_done()
+
+    def __apply(self, opcodes: List[Opcode], new: List[str], old_line_count: int) -> None:
+        if not opcodes:
+            return
+        text = self.__text
+        text.mark_set(_VIEW_MARK, "@0,0")
+        text.mark_gravity(_VIEW_MARK, "left")
+        undo = text.tk.getboolean(text.cget("undo"))
+        autoseparators = text.cget("autoseparators")
+        if undo:
+            text.edit_separator()
+            text.configure(autoseparators=False)
+        try:
+            apply_line_opcodes(text, opcodes, new, old_line_count)
+        finally:
+            if undo:
+                text.edit_separator()
+                text.configure(autoseparators=autoseparators)
+            text.yview(_VIEW_MARK)
+            text.mark_unset(_VIEW_MARK)
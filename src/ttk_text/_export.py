@@ -0,0 +1,183 @@
+import codecs
+from contextlib import suppress
+from itertools import count
+from time import perf_counter
+from tkinter import TclError, Text
+from typing import IO, Any, Callable, Iterator, Optional, Tuple
+
+_DEFAULT_CHUNK_LINES = 1024
+# Upper bound of a chunk, so very long lines do not make a chunk unbounded.
+_MAX_CHUNK_CHARS = 1024 * 1024
+
+_mark_ids = count()
+
+
+def iter_chunk_ranges(text: Text, start: str, end: str, lines: int = _DEFAULT_CHUNK_LINES) -> Iterator[Tuple[str, str]]:
+    """
+    Split a range of a text widget into chunks of at most ``lines`` lines.
+
+    Each range must be read before the next one is requested. The positions are kept by marks, so edits
+    between chunks do not shift the following ranges.
+    """
+    number = next(_mark_ids)
+    cursor, stop = f"ttk_text_export{number}", f"ttk_text_export{number}_end"
+    text.mark_set(cursor, start)
+    text.mark_gravity(cursor, "left")
+    text.mark_set(stop, end)
+    try:
+        while text.compare(cursor, "<", stop):
+            chunk_start = text.index(cursor)
+            chunk_end = text.index(f"{cursor} +{max(lines, 1)} lines linestart")
+            if text.compare(chunk_end, "<=", cursor):  # Clamped on the last line
+                chunk_end = text.index(stop)
+            for limit in (f"{cursor} +{_MAX_CHUNK_CHARS} chars", stop):
+                if text.compare(limit, "<", chunk_end):
+                    chunk_end = text.index(limit)
+            text.mark_set(cursor, chunk_end)
+            yield chunk_start, chunk_end
+    finally:
+        with suppress(TclError):  # The text may have been destroyed
+            text.mark_unset(cursor, stop)
+
+
+def iter_chunks(text: Text, start: str, end: str, lines: int = _DEFAULT_CHUNK_LINES) -> Iterator[str]:
+    """Yield the content of a range of a text widget in chunks of at most ``lines`` lines."""
+    for chunk_start, chunk_end in iter_chunk_ranges(text, start, end, lines):
+        yield text.get(chunk_start, chunk_end)
+
+
+def export_steps(
+    text: Text,
+    file: IO[Any],
+    start: str,
+    end: str,
+    *,
+    encoding: Optional[str] = None,
+    errors: str = "strict",
+    dump_file: Optional[IO[Any]] = None,
+    lines: int = _DEFAULT_CHUNK_LINES,
+) -> Iterator[int]:
+    """
+    Write a range of a text widget to a file chunk by chunk, yielding the number of characters written.
+
+    Tags and marks are written to ``dump_file`` as ``key<TAB>value<TAB>index`` lines, where key is
+    "tagon", "tagoff" or "mark". Tags already on at the start are written as a "tagon" at the start,
+    tags still on at the end have no "tagoff".
+    """
+    # One incremental encoder per file, so codecs writing a BOM write it only once.
+    encoders = {}
+    if encoding is not None:
+        encoders = {id(target): codecs.getincrementalencoder(encoding)(errors) for target in (file, dump_file)}
+
+    def write(target: IO[Any], chars: str, *, final: bool = False) -> None:
+        if encoding is None:
+            target.write(chars)
+        else:
+            target.write(encoders[id(target)].encode(chars, final=final))
+
+    exported = 0
+    first = True
+    for chunk_start, chunk_end in iter_chunk_ranges(text, start, end, lines):
+        chars = text.get(chunk_start, chunk_end)
+        write(file, chars)
+        exported += len(chars)
+        if dump_file is not None:
+            records = []
+            if first and text.compare(chunk_start, ">", "1.0"):
+                # Tags that started before the range have no toggle in it.
+                open_tags = set(text.tag_names(f"{chunk_start} -1c")).intersection(text.tag_names(chunk_start))
+                records.extend(f"tagon\t{tag}\t{chunk_start}\n" for tag in sorted(open_tags))
+            records.extend(
+                f"{key}\t{value}\t{index}\n"
+                for key, value, index in text.dump(chunk_start, chunk_end, tag=True, mark=True)
+                if not (key == "mark" and value.startswith("ttk_text_export"))
+            )
+            write(dump_file, "".join(records))
+        first = False
+        yield exported
+    write(file, "", final=True)
+    if dump_file is not None:
+        write(dump_file, "", final=True)
+
+
+class TextExport:
+    """
+    Write a range of a text widget to a file over several event loop slices.
+
+    The text is read and written in chunks of lines, so memory usage is bounded by the chunk size rather
+    than the size of the text, and the event loop can process input and redraws between slices.
+
+    :ivar exported: Number of characters written so far
+    :ivar finished: Whether the export completed or was cancelled
+    :ivar cancelled: Whether the export was cancelled
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        steps: Iterator[int],
+        *,
+        time_budget: float = 0.008,
+        on_progress: Optional[Callable[[int], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Start exporting.
+
+        :param text: Text widget being exported
+        :param steps: Steps of the export, see `export_steps`
+        :param time_budget: Time in seconds each slice may spend exporting
+        :param on_progress: Called after each slice with the number of written characters
+        :param on_done: Called once with True when the whole range is written, False when cancelled
+        """
+        self.__text = text
+        self.__steps = steps
+        self.__time_budget = time_budget
+        self.__on_progress = on_progress
+        self.__on_done = on_done
+        self.exported = 0
+        self.finished = False
+        self.cancelled = False
+        self.__task_id: Optional[str] = text.after_idle(self.__step)
+
+    def cancel(self) -> None:
+        """Stop exporting, the chunks written so far are kept."""
+        if self.finished:
+            return
+        self.cancelled = True
+        self.__finish()
+
+    def __step(self) -> None:
+        self.__task_id = None
+        deadline = perf_counter() + self.__time_budget
+        completed = False
+        try:
+            while True:
+                exported = next(self.__steps, None)
+                if exported is None:
+                    completed = True
+                    break
+                self.exported = exported
+                if perf_counter() >= deadline:
+                    break
+        except BaseException:
+            self.cancelled = True
+            self.__finish()
+            raise
+        if self.__on_progress is not None:
+            self.__on_progress(self.exported)
+        if completed:
+            self.__finish()
+            return
+        self.__task_id = self.__text.after(1, self.__step)
+
+    def __finish(self) -> None:
+        self.finished = True
+        if self.__task_id is not None:
+            self.__text.after_cancel(self.__task_id)
+            self.__task_id = None
+        close = getattr(self.__steps, "close", None)
+        if close is not None:
+            close()  # Releases the marks of the export
+        if self.__on_done is not None:
+            self.__on_done(not self.cancelled)
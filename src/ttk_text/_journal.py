@@ -0,0 +1,162 @@
+from tkinter import Misc, Text
+from typing import Callable, List, NamedTuple, Optional
+from weakref import WeakSet
+
+from ttk_text._utils import widget_path
+
+_DISPATCH_COMMAND = "::ttk_text::journal_dispatch"
+
+# The widget command is renamed and replaced by an alias to this procedure, so edits made by Tk
+# bindings are seen as well. Only edits call back into Python, other subcommands are forwarded.
+# Undo and redo do not report their range, they are recorded as a change of the whole text.
+_JOURNAL_SCRIPT = f"""
+namespace eval ::ttk_text {{}}
+proc ::ttk_text::last_line {{widget}} {{
+    return [lindex [split [$widget index end-1c] .] 0]
+}}
+proc {_DISPATCH_COMMAND} {{orig callback command args}} {{
+    if {{$command ni {{insert delete replace edit}}}} {{
+        return [uplevel 1 [list $orig $command {{*}}$args]]
+    }}
+    set last [::ttk_text::last_line $orig]
+    if {{$command eq "edit"}} {{
+        set result [uplevel 1 [list $orig $command {{*}}$args]]
+        if {{[lindex $args 0] in {{undo redo}}}} {{
+            $callback 1 $last [::ttk_text::last_line $orig]
+        }}
+        return $result
+    }}
+    switch -- $command {{
+        insert {{set indices [lrange $args 0 0]}}
+        delete {{
+            set indices $args
+            if {{[llength $args] == 1}} {{lappend indices "[lindex $args 0] +1c"}}
+        }}
+        replace {{set indices [lrange $args 0 1]}}
+    }}
+    set first $last
+    set old_last 1
+    foreach index $indices {{
+        set line [lindex [split [$orig index $index] .] 0]
+        if {{$line > $last}} {{set line $last}}
+        if {{$line < $first}} {{set first $line}}
+        if {{$line > $old_last}} {{set old_last $line}}
+    }}
+    set result [uplevel 1 [list $orig $command {{*}}$args]]
+    set delta [expr {{[::ttk_text::last_line $orig] - $last}}]
+    $callback $first $old_last [expr {{$old_last + $delta}}]
+    return $result
+}}
+proc ::ttk_text::journal_cleanup {{widget old new op}} {{
+    catch {{rename $widget {{}}}}
+}}
+"""
+
+
+class LineChange(NamedTuple):
+    """
+    A change of a range of lines: lines ``first`` to ``old_last`` were replaced by ``first`` to ``new_last``.
+
+    Line numbers are 1-based and inclusive, ``new_last - old_last`` is the number of inserted lines.
+    """
+
+    first: int
+    old_last: int
+    new_last: int
+
+    def merge(self, later: "LineChange") -> "LineChange":
+        """Return a single change covering this change followed by a later one."""
+        delta = self.new_last - self.old_last
+        # End of this change, after the later change.
+        if self.new_last < later.first:
+            new_last = self.new_last
+        elif self.new_last > later.old_last:
+            new_last = self.new_last + later.new_last - later.old_last
+        else:
+            new_last = later.new_last
+        # End of the later change, before this change.
+        if later.old_last < self.first:
+            old_last = later.old_last
+        elif later.old_last > self.new_last:
+            old_last = later.old_last - delta
+        else:
+            old_last = self.old_last
+        return LineChange(min(self.first, later.first), max(self.old_last, old_last), max(new_last, later.new_last))
+
+
+class EditJournal:
+    """
+    Track the lines changed in a text widget, including edits made by Tk bindings.
+
+    The widget command is intercepted in Tcl, only inserts, deletes, replaces and undo/redo call back into
+    Python. Changes are recorded as line ranges and delivered to subscribers once per idle cycle. Changes
+    of adjacent or overlapping lines are merged into a single `LineChange`, distant ones are delivered in
+    order as separate changes, each relative to the text after the changes before it.
+
+    :ivar pending: Changes recorded since the last delivery
+    """
+
+    __installed_roots: "WeakSet[Misc]" = WeakSet()
+
+    def __init__(self, text: Text):
+        self.__text = text
+        self.__widget = widget_path(text)
+        self.__orig = f"::ttk_text::journal{self.__widget}"
+        self.__subscribers: List[Callable[[LineChange], None]] = []
+        self.__flush_task_id: Optional[str] = None
+        self.pending: List[LineChange] = []
+
+        root = text.nametowidget(".")
+        if root not in EditJournal.__installed_roots:
+            text.tk.eval(_JOURNAL_SCRIPT)
+            EditJournal.__installed_roots.add(root)
+        self.__record_command = text.register(self.__record)
+        self.__flush_command = text.register(self.flush)
+        text.tk.call("rename", self.__widget, self.__orig)
+        text.tk.call("interp", "alias", "", self.__widget, "", _DISPATCH_COMMAND, self.__orig, self.__record_command)
+        # Deleting the widget deletes the renamed command, the alias is deleted with it.
+        text.tk.call("trace", "add", "command", self.__orig, "delete", ("::ttk_text::journal_cleanup", self.__widget))
+
+    def subscribe(self, callback: Callable[[LineChange], None]) -> None:
+        """Call a function once per idle cycle with each merged change of the lines edited during the cycle."""
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[LineChange], None]) -> None:
+        self.__subscribers.remove(callback)
+
+    def close(self) -> None:
+        """Stop delivering changes, e.g. because the text is being destroyed."""
+        if self.__flush_task_id is not None:
+            self.__text.tk.call("after", "cancel", self.__flush_task_id)
+            self.__flush_task_id = None
+        self.__subscribers.clear()
+        self.pending.clear()
+
+    def flush(self) -> List[LineChange]:
+        """
+        Deliver the pending changes now.
+
+        :return: The delivered changes, empty if nothing changed
+        """
+        if self.__flush_task_id is not None:
+            self.__text.tk.call("after", "cancel", self.__flush_task_id)
+            self.__flush_task_id = None
+        if not self.pending:
+            return []
+        changes = [self.pending[0]]
+        for later in self.pending[1:]:
+            change = changes[-1]
+            if later.first <= change.new_last + 1 and later.old_last >= change.first - 1:
+                changes[-1] = change.merge(later)
+            else:
+                changes.append(later)
+        self.pending.clear()
+        for change in changes:
+            for callback in list(self.__subscribers):
+                callback(change)
+        return changes
+
+    def __record(self, first: str, old_last: str, new_last: str) -> None:
+        self.pending.append(LineChange(int(first), int(old_last), int(new_last)))
+        if self.__flush_task_id is None:
+            self.__flush_task_id = self.__text.tk.call("after", "idle", self.__flush_command)
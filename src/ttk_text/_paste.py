@@ -0,0 +1,119 @@
+from tkinter import Event, TclError, Text
+from typing import Callable, Iterator, Optional
+
+from ttk_text._stream import InsertStream
+from ttk_text._utils import unbind_funcid
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class PasteHandler:
+    """
+    Paste large clipboard contents in time-sliced chunks, as a single undo step.
+
+    Pastes smaller than the threshold, or into a disabled text, keep the native ``<<Paste>>`` binding.
+    Larger ones are inserted with an `InsertStream` at the insert cursor, with automatic undo separators
+    suspended while streaming, so a single undo removes the whole paste. A paste requested while another
+    one is still streaming is refused with a bell.
+
+    :ivar threshold: Size in characters from which pastes are chunked
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        *,
+        threshold: int = 256 * 1024,
+        time_budget: float = 0.008,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Install the handler on a text widget.
+
+        :param text: Text widget
+        :param threshold: Size in characters from which pastes are chunked
+        :param time_budget: Time in seconds each slice may spend inserting
+        :param on_progress: Called after each slice with the inserted and total number of characters
+        :param on_done: Called once per chunked paste, with True when completed and False when cancelled
+        """
+        self.__text = text
+        self.__time_budget = time_budget
+        self.__on_progress = on_progress
+        self.__on_done = on_done
+        self.__stream: Optional[InsertStream] = None
+        self.__total = 0
+        self.__autoseparators = None
+        self.threshold = threshold
+        self.__funcid: Optional[str] = text.bind("<<Paste>>", self.__on_paste, "+")
+
+    @property
+    def active(self) -> bool:
+        """Whether a chunked paste is in progress."""
+        return self.__stream is not None
+
+    def cancel(self) -> None:
+        """Stop the paste in progress, the part already inserted is kept as a single undo step."""
+        if self.__stream is not None:
+            self.__stream.cancel()
+
+    def remove(self) -> None:
+        """Restore the native paste binding, a paste in progress is completed."""
+        if self.__funcid is not None:
+            unbind_funcid(self.__text, "<<Paste>>", self.__funcid)
+            self.__funcid = None
+
+    def __chunks(self, payload: str) -> Iterator[str]:
+        for start in range(0, len(payload), _CHUNK_SIZE):
+            yield payload[start : start + _CHUNK_SIZE]
+
+    def __on_paste(self, _: Event) -> Optional[str]:
+        if self.__stream is not None:
+            self.__text.bell()
+            return "break"
+        text = self.__text
+        if str(text.cget("state")) == "disabled":
+            return None  # Inserts would be ignored, the native binding does nothing either
+        try:
+            payload = text.clipboard_get()
+        except TclError:
+            return None  # Empty clipboard, or not text
+        if len(payload) < self.threshold:
+            return None
+        # Like the native binding, replace the selection except on X11.
+        if text.tk.call("tk", "windowingsystem") != "x11" and text.tag_ranges("sel"):
+            text.delete("sel.first", "sel.last")
+
+        undo = text.tk.getboolean(text.cget("undo"))
+        if undo:
+            self.__autoseparators = text.cget("autoseparators")
+            text.edit_separator()
+            text.configure(autoseparators=False)
+        self.__total = len(payload)
+        self.__stream = InsertStream(
+            text,
+            "insert",
+            self.__chunks(payload),
+            time_budget=self.__time_budget,
+            on_progress=self.__progress,
+            on_done=self.__done,
+        )
+        return "break"
+
+    def __progress(self, inserted: int) -> None:
+        self.__text.see("insert")
+        if self.__on_progress is not None:
+            self.__on_progress(inserted, self.__total)
+
+    def __done(self, completed: bool) -> None:
+        self.__stream = None
+        text = self.__text
+        try:
+            if self.__autoseparators is not None:
+                text.edit_separator()
+                text.configure(autoseparators=self.__autoseparators)
+        except TclError:  # The text has been destroyed
+            pass
+        self.__autoseparators = None
+        if self.__on_done is not None:
+            self.__on_done(completed)
@@ -0,0 +1,163 @@
+from time import perf_counter
+from tkinter import Misc, Tk
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional
+from weakref import WeakKeyDictionary, WeakSet
+
+from ttk_text import instrumentation
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from ttk_text import ThemedTextFrame
+
+_RESTYLE_COMMAND = "::ttk_text::restyle_frames"
+_FLUSH_STYLE_UPDATES_COMMAND = "::ttk_text::flush_style_updates"
+
+
+class ThemeChangeCoordinator:
+    """
+    Re-style all ThemedTextFrames of a Tcl interpreter in a single idle pass.
+
+    Tk sends ``<<ThemeChanged>>`` to every widget, so without coordination each frame would update
+    its style separately. Frames only schedule the coordinator instead, which then updates every live
+    frame once the event storm is over. Lookups are shared through the style lookup cache, so the theme
+    is resolved once for all frames using the same style.
+
+    :ivar last_frame_count: Number of frames updated by the last pass
+    :ivar last_duration: Duration of the last pass in seconds
+    :ivar total_duration: Accumulated duration of all passes in seconds
+    :ivar on_restyled: Optional callback receiving the frame count and duration of each pass
+    """
+
+    __instances: "MutableMapping[Tk, ThemeChangeCoordinator]" = WeakKeyDictionary()
+
+    def __init__(self, root: Tk):
+        self.__tk = root.tk
+        self.__frames: WeakSet[ThemedTextFrame] = WeakSet()
+        self.__pending = False
+        self.last_frame_count = 0
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+        self.on_restyled: Optional[Callable[[int, float], None]] = None
+
+        # A permanent command avoids registering a new Tcl command for each scheduled pass.
+        self.__tk.createcommand(_RESTYLE_COMMAND, self.__restyle)
+
+    @classmethod
+    def of(cls, widget: Misc) -> "ThemeChangeCoordinator":
+        """Return the coordinator shared by the interpreter of the widget, creating it if necessary."""
+        root = widget.nametowidget(".")
+        coordinator = cls.__instances.get(root)
+        if coordinator is None:
+            coordinator = cls.__instances[root] = cls(root)
+        return coordinator
+
+    def register(self, frame: "ThemedTextFrame") -> None:
+        self.__frames.add(frame)
+
+    def unregister(self, frame: "ThemedTextFrame") -> None:
+        self.__frames.discard(frame)
+
+    def schedule(self) -> None:
+        """Schedule an update of all registered frames, if one is not already pending."""
+        if not self.__pending:
+            self.__pending = True
+            self.__tk.call("after", "idle", _RESTYLE_COMMAND)
+
+    def __restyle(self) -> None:
+        self.__pending = False
+        start = perf_counter()
+        frames = list(self.__frames)
+        for frame in frames:
+            frame.update_style()
+        duration = perf_counter() - start
+        self.last_frame_count = len(frames)
+        self.last_duration = duration
+        self.total_duration += duration
+        if instrumentation.enabled:
+            instrumentation.record("theme_restyle", start)
+        if self.on_restyled is not None:
+            self.on_restyled(len(frames), duration)
+
+
+class StyleUpdateScheduler:
+    """
+    Collect stateful style updates of a Tcl interpreter and flush them in a single callback.
+
+    State events (FocusIn/FocusOut/Enter/Leave, ...) mark their frame as dirty instead of scheduling
+    an idle callback per frame. A single callback then updates every dirty frame, so the cost scales
+    with the number of dirty frames rather than with the number of events.
+
+    :ivar max_flush_rate: Maximum number of flushes per second, None to flush on the next idle
+    :ivar requests: Number of update requests
+    :ivar merged: Number of requests merged into an already pending update of the same frame
+    :ivar flushes: Number of flushes
+    :ivar flushed_updates: Number of updates executed by flushes
+    """
+
+    __instances: "MutableMapping[Tk, StyleUpdateScheduler]" = WeakKeyDictionary()
+
+    def __init__(self, root: Tk):
+        self.__tk = root.tk
+        self.__dirty: Dict[Hashable, Callable[[], None]] = {}
+        self.__pending = False
+        self.__last_flush = 0.0
+        self.max_flush_rate: Optional[float] = None
+        self.requests = 0
+        self.merged = 0
+        self.flushes = 0
+        self.flushed_updates = 0
+
+        self.__tk.createcommand(_FLUSH_STYLE_UPDATES_COMMAND, self.flush)
+
+    @classmethod
+    def of(cls, widget: Misc) -> "StyleUpdateScheduler":
+        """Return the scheduler shared by the interpreter of the widget, creating it if necessary."""
+        root = widget.nametowidget(".")
+        scheduler = cls.__instances.get(root)
+        if scheduler is None:
+            scheduler = cls.__instances[root] = cls(root)
+        return scheduler
+
+    def mark_dirty(self, key: Hashable, update: Callable[[], None]) -> bool:
+        """
+        Request an update, merged with any pending update of the same key.
+
+        :param key: Identity of the update, usually the frame
+        :param update: Callback executed by the next flush
+        :return: False if the request was merged into a pending update of the key
+        """
+        self.requests += 1
+        merged = key in self.__dirty
+        if merged:
+            self.merged += 1
+        self.__dirty[key] = update
+        if self.__pending:
+            return not merged
+        self.__pending = True
+        delay = 0.0
+        if self.max_flush_rate:
+            delay = self.__last_flush + 1 / self.max_flush_rate - perf_counter()
+        if delay > 0:
+            self.__tk.call("after", max(1, round(delay * 1000)), _FLUSH_STYLE_UPDATES_COMMAND)
+        else:
+            self.__tk.call("after", "idle", _FLUSH_STYLE_UPDATES_COMMAND)
+        return not merged
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the pending update of a key, e.g. because it was applied directly or the widget was destroyed."""
+        self.__dirty.pop(key, None)
+
+    def flush(self) -> None:
+        """Execute all pending updates now."""
+        self.__pending = False
+        self.__last_flush = perf_counter()
+        dirty, self.__dirty = self.__dirty, {}
+        if not dirty:
+            return
+        self.flushes += 1
+        self.flushed_updates += len(dirty)
+        for update in dirty.values():
+            update()
+        if instrumentation.enabled:
+            instrumentation.record("style_update_flush", self.__last_flush)
@@ -0,0 +1,185 @@
+from collections import deque
+from contextlib import suppress
+from threading import Condition, get_ident
+from time import perf_counter
+from tkinter import Event, TclError, Text
+from typing import Callable, Deque, List, Optional, Tuple, Union
+
+from ttk_text._stream import Tags
+from ttk_text._utils import unbind_funcid
+
+_READY_EVENT = "<<TextSinkReady>>"
+
+_MIN_BATCH_SIZE = 4 * 1024
+_MAX_BATCH_SIZE = 1024 * 1024
+
+
+class TextSink:
+    """
+    A thread-safe, file-like sink feeding a text widget from background threads.
+
+    Producers call ``write`` from any thread. Only the first write into an empty buffer wakes the
+    main loop, through a single ``<<TextSinkReady>>`` event; the main loop then drains the buffer in
+    batches sized to stay within a time budget per slice. When more than ``max_buffered`` characters
+    are waiting, ``write`` blocks until the main loop catches up.
+
+    .. note::
+        Tk calls from other threads are marshalled to the main thread by tkinter, which requires a
+        threaded Tcl build and a running main loop.
+
+    :ivar written: Number of characters written by producers
+    :ivar inserted: Number of characters inserted into the text
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        insert_batch: Callable[[List[Union[str, Tags]]], None],
+        *,
+        tags: Tags = (),
+        max_buffered: int = 1024 * 1024,
+        time_budget: float = 0.008,
+    ):
+        """
+        Create a sink, it must be created on the thread running the Tk main loop.
+
+        :param text: Text widget receiving the writes
+        :param insert_batch: Inserts alternating strings and tags into the text
+        :param tags: Tags of the written text
+        :param max_buffered: Number of buffered characters above which writes block
+        :param time_budget: Time in seconds each drain slice may spend inserting
+        """
+        self.__text = text
+        self.__insert_batch = insert_batch
+        self.__tags = tags
+        self.__max_buffered = max_buffered
+        self.__time_budget = time_budget
+        self.__owner_thread = get_ident()
+        self.__condition = Condition()
+        self.__buffer: Deque[Tuple[str, Tags]] = deque()
+        self.__buffered = 0
+        self.__wake_pending = False
+        self.__drain_task_id: Optional[str] = None
+        self.__batch_size = _MIN_BATCH_SIZE
+        self.__closed = False
+        self.written = 0
+        self.inserted = 0
+
+        self.__ready_funcid: Optional[str] = text.bind(_READY_EVENT, self.__on_ready, "+")
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def write(self, chars: str, tags: Optional[Tags] = None, *, timeout: Optional[float] = None) -> int:
+        """
+        Write text from any thread.
+
+        :param chars: Text to write
+        :param tags: Tags of the text, defaults to the tags of the sink
+        :param timeout: Maximum time in seconds to wait for buffer space, None to wait indefinitely
+        :return: Number of written characters
+        :raises ValueError: If the sink is closed
+        :raises TimeoutError: If the buffer stayed full for longer than ``timeout``
+        """
+        if not chars:
+            return 0
+        on_owner_thread = get_ident() == self.__owner_thread
+        with self.__condition:
+            if self.__closed:
+                raise ValueError("I/O operation on closed sink")
+            # The main loop cannot drain while its own thread waits, so it is never blocked.
+            if not on_owner_thread and not self.__condition.wait_for(self.__has_space, timeout):
+                raise TimeoutError("Text sink is full")
+            if self.__closed:
+                raise ValueError("I/O operation on closed sink")
+            self.__buffer.append((chars, self.__tags if tags is None else tags))
+            self.__buffered += len(chars)
+            self.written += len(chars)
+            wake = not self.__wake_pending
+            self.__wake_pending = True
+        if wake:
+            try:
+                self.__text.event_generate(_READY_EVENT, when="tail")
+            except TclError:  # The text has been destroyed
+                self.close()
+        return len(chars)
+
+    def flush(self) -> None:
+        """Do nothing, written text is delivered by the main loop."""
+
+    def close(self) -> None:
+        """
+        Close the sink, text already written is still inserted.
+
+        The ``<<TextSinkReady>>`` binding is removed by the main loop once the buffer is drained.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__condition.notify_all()
+            wake = not self.__wake_pending
+            self.__wake_pending = True
+        if wake:
+            # Nothing is waiting to be drained, wake the main loop so it releases the binding.
+            with suppress(TclError):  # The text has been destroyed together with its bindings
+                self.__text.event_generate(_READY_EVENT, when="tail")
+
+    def __has_space(self) -> bool:
+        return self.__closed or self.__buffered < self.__max_buffered
+
+    def __take_batch(self) -> List[Union[str, Tags]]:
+        """Take buffered writes for one insert call, as alternating strings and tags."""
+        args: List[Union[str, Tags]] = []
+        parts: List[str] = []
+        last_tags: Tags = ()
+        size = 0
+        with self.__condition:
+            while self.__buffer and size < self.__batch_size:
+                chars, tags = self.__buffer.popleft()
+                if parts and tags != last_tags:
+                    args.extend(("".join(parts), last_tags))
+                    parts = []
+                parts.append(chars)
+                last_tags = tags
+                size += len(chars)
+            if parts:
+                args.extend(("".join(parts), last_tags))
+            self.__buffered -= size
+            if not self.__buffer:
+                self.__wake_pending = False
+            self.__condition.notify_all()
+        return args
+
+    def __on_ready(self, _: Event) -> None:
+        if self.__drain_task_id is None:
+            self.__drain()
+
+    def __drain(self) -> None:
+        self.__drain_task_id = None
+        deadline = perf_counter() + self.__time_budget
+        while True:
+            args = self.__take_batch()
+            if not args:
+                if self.__closed:
+                    self.__release()
+                break
+            start = perf_counter()
+            self.__insert_batch(args)
+            end = perf_counter()
+            self.inserted += sum(len(part) for part in args[::2])
+            if end - start < self.__time_budget / 8:
+                self.__batch_size = min(self.__batch_size * 2, _MAX_BATCH_SIZE)
+            elif end - start > self.__time_budget / 4:
+                self.__batch_size = max(self.__batch_size // 2, _MIN_BATCH_SIZE)
+            if end >= deadline:
+                # Continue after pending events and redraws, without another wake up event.
+                self.__drain_task_id = self.__text.after(1, self.__drain)
+                break
+
+    def __release(self) -> None:
+        if self.__ready_funcid is not None:
+            with suppress(TclError):
+                unbind_funcid(self.__text, _READY_EVENT, self.__ready_funcid)
+            self.__ready_funcid = None
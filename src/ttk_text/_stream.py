@@ -0,0 +1,152 @@
+from contextlib import suppress
+from itertools import count
+from time import perf_counter
+from tkinter import TclError, Text
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
+
+Tags = Union[str, Tuple[str, ...]]
+Chunk = Union[str, Tuple[str, Tags]]
+
+_MIN_BATCH_SIZE = 4 * 1024
+_MAX_BATCH_SIZE = 4 * 1024 * 1024
+
+_mark_ids = count()
+
+
+def insert_batch(text: Text, index: str, args: Sequence[Union[str, Tags]]) -> None:
+    """Insert alternating strings and tags, as built by the batching code, with a single ``insert`` call."""
+    text.insert(index, cast("str", args[0]), *args[1:])
+
+
+class InsertStream:
+    """
+    Insert an iterable of strings into a text widget over several event loop slices.
+
+    Chunks are joined into batches which are inserted with a single ``insert`` call each, consecutive
+    chunks with the same tags are merged. The batch size is tuned from the measured insert time so each
+    slice stays within its time budget, and the event loop can process input and redraws between slices.
+
+    Chunks may be plain strings, inserted with the default tags, or ``(string, tags)`` tuples.
+
+    :ivar inserted: Number of characters inserted so far
+    :ivar finished: Whether the stream completed or was cancelled
+    :ivar cancelled: Whether the stream was cancelled
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        index: str,
+        chunks: Iterable[Chunk],
+        tags: Tags = (),
+        *,
+        time_budget: float = 0.008,
+        on_progress: Optional[Callable[[int], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Start streaming chunks into a text widget.
+
+        :param text: Text widget to insert into
+        :param index: Index where the chunks are inserted
+        :param chunks: Iterable or generator of chunks
+        :param tags: Tags of plain string chunks
+        :param time_budget: Time in seconds each slice may spend inserting
+        :param on_progress: Called after each slice with the number of inserted characters
+        :param on_done: Called once with True when all chunks are inserted, False when cancelled
+        """
+        self.__text = text
+        self.__chunks: Iterator[Chunk] = iter(chunks)
+        self.__tags = tags
+        self.__time_budget = time_budget
+        self.__on_progress = on_progress
+        self.__on_done = on_done
+        self.__batch_size = _MIN_BATCH_SIZE
+        self.inserted = 0
+        self.finished = False
+        self.cancelled = False
+
+        # A right gravity mark keeps track of the insert position while the text changes between slices.
+        self.__mark = f"ttk_text_stream{next(_mark_ids)}"
+        text.mark_set(self.__mark, index)
+        text.mark_gravity(self.__mark, "right")
+        self.__task_id: Optional[str] = text.after_idle(self.__step)
+
+    def cancel(self) -> None:
+        """Stop inserting, the chunks inserted so far are kept."""
+        if self.finished:
+            return
+        self.cancelled = True
+        self.__finish()
+
+    def __next_chunk(self) -> Optional[Tuple[str, Tags]]:
+        chunk = next(self.__chunks, None)
+        if isinstance(chunk, str):
+            return chunk, self.__tags
+        return chunk
+
+    def __next_batch(self) -> List[Union[str, Tags]]:
+        """Return the arguments of the next insert call as alternating strings and tags."""
+        args: List[Union[str, Tags]] = []
+        parts: List[str] = []
+        tags: Tags = ()
+        size = 0
+        while size < self.__batch_size:
+            chunk = self.__next_chunk()
+            if chunk is None:
+                break
+            if parts and chunk[1] != tags:
+                args.extend(("".join(parts), tags))
+                parts = []
+            parts.append(chunk[0])
+            tags = chunk[1]
+            size += len(chunk[0])
+        if parts:
+            args.extend(("".join(parts), tags))
+        return args
+
+    def __tune_batch_size(self, elapsed: float) -> None:
+        target = self.__time_budget / 4
+        if elapsed < target / 2:
+            self.__batch_size = min(self.__batch_size * 2, _MAX_BATCH_SIZE)
+        elif elapsed > target:
+            self.__batch_size = max(self.__batch_size // 2, _MIN_BATCH_SIZE)
+
+    def __step(self) -> None:
+        self.__task_id = None
+        deadline = perf_counter() + self.__time_budget
+        completed = False
+        try:
+            while True:
+                args = self.__next_batch()
+                if not args:
+                    completed = True
+                    break
+                start = perf_counter()
+                insert_batch(self.__text, self.__mark, args)
+                end = perf_counter()
+                self.inserted += sum(len(part) for part in args[::2])
+                self.__tune_batch_size(end - start)
+                if end >= deadline:
+                    break
+        except BaseException:
+            self.cancelled = True
+            self.__finish()
+            raise
+        if self.__on_progress is not None:
+            self.__on_progress(self.inserted)
+        if completed:
+            self.__finish()
+            return
+        # A short timer instead of an idle callback lets pending redraws run between slices.
+        self.__task_id = self.__text.after(1, self.__step)
+
+    def __finish(self) -> None:
+        self.finished = True
+        if self.__task_id is not None:
+            self.__text.after_cancel(self.__task_id)
+            self.__task_id = None
+        with suppress(TclError):  # The text may have been destroyed
+            self.__text.mark_unset(self.__mark)
+        if self.__on_done is not None:
+            self.__on_done(not self.cancelled)
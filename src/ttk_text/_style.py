@@ -0,0 +1,157 @@
+from itertools import combinations
+from time import perf_counter
+from tkinter import Misc, Tk
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from ttk_text import instrumentation
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+LookupKey = Tuple[str, str, FrozenSet[str]]
+
+# States that ThemedTextFrame toggles by itself, every combination of them is resolved ahead of time.
+_APPEARANCE_TABLE_STATES = ("focus", "hover", "pressed", "active")
+
+_INVALIDATE_COMMAND = "::ttk_text::invalidate_style_cache"
+
+# Only commands that can change the result of `ttk::style lookup` or `option get` invalidate the cache.
+# Queries such as `ttk::style configure name` or `ttk::style theme use` (without a theme name) are ignored.
+_TRACE_SCRIPT = f"""
+namespace eval ::ttk_text {{}}
+proc ::ttk_text::trace_style_change {{command code result op}} {{
+    set subcommand [lindex $command 1]
+    if {{($subcommand in {{configure map}} && [llength $command] >= 5)
+        || ($subcommand eq "theme" && [lindex $command 2] in {{use settings}} && [llength $command] >= 4)}} {{
+        {_INVALIDATE_COMMAND}
+    }}
+}}
+proc ::ttk_text::trace_option_change {{command code result op}} {{
+    if {{[lindex $command 1] in {{add clear readfile}}}} {{
+        {_INVALIDATE_COMMAND}
+    }}
+}}
+trace add execution ::ttk::style leave ::ttk_text::trace_style_change
+trace add execution ::option leave ::ttk_text::trace_option_change
+"""
+
+
+class Appearance(NamedTuple):
+    """
+    The stateful appearance of a text widget resolved from a style.
+
+    Options that are not set by the style are None, so they are skipped by ``configure``.
+    """
+
+    background: Any
+    foreground: Any
+    selectforeground: Any
+
+
+class StyleLookupCache:
+    """
+    A style lookup cache shared by all widgets of a Tcl interpreter.
+
+    Results of ``Style.lookup`` are keyed by (style name, option, state set), so repeated lookups
+    cost a dictionary hit instead of a Tcl round trip. The cache is cleared whenever the interpreter
+    executes a command that may change a lookup result:
+
+        - ``ttk::style configure`` and ``ttk::style map`` with options (``Style.configure``/``Style.map``)
+        - ``ttk::style theme use`` and ``ttk::style theme settings`` (``<<ThemeChanged>>`` is raised by these)
+        - ``option add``, ``option clear`` and ``option readfile`` (e.g. ``tk_setPalette``)
+
+    :ivar generation: Incremented on each invalidation, can be used to validate derived caches
+    :ivar hits: Number of lookups answered from the cache
+    :ivar misses: Number of lookups forwarded to Tcl
+    """
+
+    __instances: "MutableMapping[Tk, StyleLookupCache]" = WeakKeyDictionary()
+
+    def __init__(self, root: Tk):
+        # Only the interpreter is kept, a reference to the root would keep the registry entry alive.
+        self.__tk = root.tk
+        self.__values: Dict[LookupKey, Any] = {}
+        self.__appearances: Dict[str, Dict[FrozenSet[str], Appearance]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.__tk.createcommand(_INVALIDATE_COMMAND, self.invalidate)
+        self.__tk.eval(_TRACE_SCRIPT)
+
+    @classmethod
+    def of(cls, widget: Misc) -> "StyleLookupCache":
+        """Return the cache shared by the interpreter of the widget, creating it if necessary."""
+        root = widget.nametowidget(".")
+        cache = cls.__instances.get(root)
+        if cache is None:
+            cache = cls.__instances[root] = cls(root)
+        return cache
+
+    def lookup(self, style: str, option: str, state: Optional[Iterable[str]] = None) -> Any:
+        """
+        Return the value of an option of a style, like ``Style.lookup``.
+
+        :param style: ttk style name
+        :param option: Option name without the leading dash
+        :param state: State specification to look up the value for
+        :return: The raw lookup result, an empty string if the option is not set
+        """
+        key = (style, option, frozenset(state) if state else frozenset())
+        try:
+            result = self.__values[key]
+        except KeyError:
+            self.misses += 1
+            timed = instrumentation.enabled
+            start = perf_counter() if timed else 0.0
+            result = self.__values[key] = self.__tk.call("ttk::style", "lookup", style, f"-{option}", " ".join(key[2]))
+            if timed:
+                instrumentation.record("style_lookup", start)
+        else:
+            self.hits += 1
+            if instrumentation.enabled:
+                instrumentation.count("style_lookup_hit")
+        return result
+
+    def appearance(self, style: str, state: Iterable[str]) -> Appearance:
+        """
+        Return the appearance of a style in a state.
+
+        The first call for a style after an invalidation builds a table of every combination of the states
+        toggled by ThemedTextFrame, later calls only index into it. Other states are resolved on demand.
+
+        :param style: ttk style name
+        :param state: Current state of the widget
+        :return: The resolved appearance
+        """
+        table = self.__appearances.get(style)
+        if table is None:
+            table = self.__appearances[style] = self.__build_appearance_table(style)
+        key = frozenset(state)
+        try:
+            return table[key]
+        except KeyError:
+            appearance = table[key] = self.__resolve_appearance(style, key)
+            return appearance
+
+    def __build_appearance_table(self, style: str) -> Dict[FrozenSet[str], Appearance]:
+        table = {}
+        for count in range(len(_APPEARANCE_TABLE_STATES) + 1):
+            for state in combinations(_APPEARANCE_TABLE_STATES, count):
+                key = frozenset(state)
+                table[key] = self.__resolve_appearance(style, key)
+        return table
+
+    def __resolve_appearance(self, style: str, state: FrozenSet[str]) -> Appearance:
+        return Appearance(
+            background=self.lookup(style, "fieldbackground", state) or None,
+            foreground=self.lookup(style, "foreground", state) or None,
+            selectforeground=self.lookup(style, "selectforeground", state) or None,
+        )
+
+    def invalidate(self) -> None:
+        """Discard all cached lookup results."""
+        self.__values.clear()
+        self.__appearances.clear()
+        self.generation += 1
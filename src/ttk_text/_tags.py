@@ -0,0 +1,60 @@
+from tkinter import Misc, Text
+from typing import Iterable, List, Mapping, Sequence, Tuple, Union
+from weakref import WeakSet
+
+from ttk_text._utils import line_starts, offsets_to_indices, widget_path
+
+Index = Union[str, int]
+
+_TAG_RANGES_COMMAND = "::ttk_text::tag_ranges"
+
+# Applies the ranges of several tags in a single evaluation from Python.
+_TAG_RANGES_SCRIPT = f"""
+namespace eval ::ttk_text {{}}
+proc {_TAG_RANGES_COMMAND} {{widget operation spans}} {{
+    foreach {{tag indices}} $spans {{
+        $widget tag $operation $tag {{*}}$indices
+    }}
+}}
+"""
+
+_installed_roots: "WeakSet[Misc]" = WeakSet()
+
+
+def to_indices(text: Text, values: Iterable[Index], base: str = "1.0") -> List[str]:
+    """
+    Convert indices to strings, integers are character offsets from ``base``.
+
+    Offsets are converted in bulk from a single ``get`` call, instead of letting Tk count characters
+    for each ``base + N chars`` index.
+    """
+    tolist = getattr(values, "tolist", None)  # array.array and NumPy arrays convert faster this way
+    items: List[Index] = tolist() if tolist is not None else list(values)
+    if not any(isinstance(item, int) for item in items):
+        return items  # type: ignore[return-value]
+    base_line, base_column = map(int, text.index(base).split("."))
+    offsets = [item for item in items if isinstance(item, int)]
+    # Only the characters up to the largest offset are read, not the rest of the text.
+    starts = line_starts(text.get(base, f"{base} +{max(offsets)}c"))
+    converted = iter(offsets_to_indices(starts, offsets, base_line, base_column))
+    return [next(converted) if isinstance(item, int) else item for item in items]
+
+
+def apply_tag_ranges(text: Text, operation: str, spans: Mapping[str, Sequence[str]]) -> None:
+    """
+    Add or remove the ranges of several tags with a single Tcl call.
+
+    :param text: Text widget
+    :param operation: "add" or "remove"
+    :param spans: Tag names mapped to flat sequences of start and end indices
+    """
+    root = text.nametowidget(".")
+    if root not in _installed_roots:
+        text.tk.eval(_TAG_RANGES_SCRIPT)
+        _installed_roots.add(root)
+    args: List[Union[str, Tuple[str, ...]]] = []
+    for tag, indices in spans.items():
+        if indices:
+            args.extend((tag, tuple(indices)))
+    if args:
+        text.tk.call(_TAG_RANGES_COMMAND, widget_path(text), operation, tuple(args))
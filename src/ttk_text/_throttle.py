@@ -0,0 +1,75 @@
+from tkinter import Misc
+
+# Frame interval in milliseconds, scroll commands are applied at most once per interval.
+FRAME_INTERVAL = 16
+
+_PROC = "::ttk_text::throttled_call"
+_CHAIN_PROC = "::ttk_text::chained_call"
+
+# Runs entirely in Tcl, so the high-rate scroll commands of the text never cross into Python.
+_SCRIPT = """
+namespace eval ::ttk_text {
+    variable pending_calls
+    array set pending_calls {}
+}
+proc ::ttk_text::throttled_call {command delay args} {
+    variable pending_calls
+    if {![info exists pending_calls($command)]} {
+        after $delay [list ::ttk_text::flush_call $command]
+    }
+    set pending_calls($command) $args
+}
+proc ::ttk_text::chained_call {commands args} {
+    foreach command $commands {
+        {*}$command {*}$args
+    }
+}
+proc ::ttk_text::flush_call {command} {
+    variable pending_calls
+    if {![info exists pending_calls($command)]} {
+        return
+    }
+    set args $pending_calls($command)
+    unset pending_calls($command)
+    # The command is gone if its widget was destroyed in the meantime.
+    if {[llength [info commands [lindex $command 0]]]} {
+        {*}$command {*}$args
+    }
+}
+"""
+
+
+def throttled_command(widget: Misc, command: str, delay: int = FRAME_INTERVAL) -> str:
+    """
+    Return a scroll command script calling a Tcl command at most once every ``delay`` milliseconds.
+
+    Only the arguments of the latest call of each interval are passed, e.g. the latest fraction pair.
+    The Tcl procedures are defined once per interpreter.
+
+    :param widget: Any widget of the interpreter
+    :param command: Tcl command prefix, e.g. the name of a registered Python function
+    :param delay: Interval in milliseconds
+    """
+    _define_procs(widget)
+    return f"{_PROC} {{{command}}} {int(delay)}"
+
+
+def chained_command(widget: Misc, *commands: str) -> str:
+    """
+    Return a scroll command script calling several Tcl command prefixes in turn, entirely in Tcl.
+
+    :param widget: Any widget of the interpreter
+    :param commands: Tcl command prefixes, e.g. a previous scroll command and a throttled hook
+    """
+    _define_procs(widget)
+    return f"{_CHAIN_PROC} {{{' '.join(f'{{{command}}}' for command in commands)}}}"
+
+
+def throttled_set_command(target: Misc, delay: int = FRAME_INTERVAL) -> str:
+    """Return a scroll command script calling ``target.set`` at most once every ``delay`` milliseconds."""
+    return throttled_command(target, f"{target} set", delay)
+
+
+def _define_procs(widget: Misc) -> None:
+    if not widget.tk.call("info", "commands", _PROC):
+        widget.tk.eval(_SCRIPT)
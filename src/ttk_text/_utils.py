@@ -1,10 +1,16 @@
-from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple, Union
+import re
+from bisect import bisect_right
+from functools import wraps
+from tkinter import Misc
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Literal, NamedTuple, Optional, Set, Tuple, Union
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 ScreenDistance = Union[float, str]
 
+_NEWLINE = re.compile("\n")
+
 
 class Padding(NamedTuple):
     left: ScreenDistance
@@ -34,3 +40,89 @@ def parse_padding(value: Union[ScreenDistance, Tuple[ScreenDistance, ...], None]
     right = padding[2] if padding[2] is not None else left
     bottom = padding[3] if padding[3] is not None else top
     return Padding(left, top, right, bottom)
+
+
+def line_starts(text: str) -> List[int]:
+    """Return the offset of the start of each line of a string."""
+    return [0, *(match.end() for match in _NEWLINE.finditer(text))]
+
+
+def offsets_to_indices(
+    starts: "Sequence[int]",
+    offsets: Iterable[int],
+    first_line: int = 1,
+    first_column: int = 0,
+) -> List[str]:
+    """
+    Convert character offsets into text indices in bulk.
+
+    :param starts: Line start offsets of the string the offsets refer to, see `line_starts`
+    :param offsets: Character offsets, converting them in ascending order is the fastest
+    :param first_line: Line number of the first line of the string in the text widget
+    :param first_column: Column of the start of the string in the text widget
+    :return: Indices in the "line.column" form
+    """
+    indices = []
+    line = 0
+    for offset in offsets:
+        # Offsets are usually ascending, so the previous line is a good lower bound.
+        if offset < starts[line]:
+            line = 0
+        line = bisect_right(starts, offset, line) - 1
+        column = offset - starts[line] + (first_column if line == 0 else 0)
+        indices.append(f"{first_line + line}.{column}")
+    return indices
+
+
+def widget_path(widget: Misc) -> str:
+    """Return the Tk path name of a widget, ``str()`` of a ThemedText is the path of its frame instead."""
+    return Misc.__str__(widget)
+
+
+def unbind_funcid(widget: Misc, sequence: str, funcid: str) -> None:
+    """
+    Remove a single binding added with ``bind(sequence, func, "+")``, keeping the other bindings.
+
+    Older versions of ``Misc.unbind`` remove every binding of the sequence.
+    """
+    script = widget.bind(sequence)
+    kept = [line for line in script.split("\n") if line and funcid not in line]
+    widget.bind(sequence, "\n".join(kept))
+    widget.deletecommand(funcid)
+
+
+class PendingTasks(Misc):
+    """
+    Widget mixin keeping the ids of the ``after`` and ``after_idle`` callbacks scheduled through the widget.
+
+    Their Tcl commands are deleted with the widget, so callbacks still queued would fail when they run,
+    `cancel_pending_tasks` cancels them before the widget is destroyed.
+    """
+
+    __task_ids: Optional[Set[str]] = None
+
+    def after(self, ms: Union[int, Literal["idle"]], func: Callable[..., object], *args: Any) -> str:
+        task_id = ""
+
+        @wraps(func)
+        def run(*run_args: Any) -> None:
+            self.__pending_task_ids().discard(task_id)
+            func(*run_args)
+
+        task_id = super().after(ms, run, *args)
+        self.__pending_task_ids().add(task_id)
+        return task_id
+
+    def after_cancel(self, id: str) -> None:  # noqa: A002 - name of the overridden parameter
+        self.__pending_task_ids().discard(id)
+        super().after_cancel(id)
+
+    def cancel_pending_tasks(self) -> None:
+        """Cancel the callbacks scheduled through the widget that have not run yet."""
+        for task_id in list(self.__pending_task_ids()):
+            self.after_cancel(task_id)
+
+    def __pending_task_ids(self) -> Set[str]:
+        if self.__task_ids is None:
+            self.__task_ids = set()
+        return self.__task_ids
@@ -0,0 +1,235 @@
+import mmap
+import os
+import re
+from array import array
+from itertools import islice
+from time import perf_counter
+from tkinter import Misc
+from typing import BinaryIO, Optional, Union
+
+from ttk_text.scrolled_text import ScrolledText
+
+__all__ = ["FileViewer"]
+
+# Only the offset of every _INDEX_STRIDE-th line is kept, other lines are found by scanning from it.
+_INDEX_STRIDE = 64
+_INDEX_CHUNK_SIZE = 4 * 1024 * 1024
+_NEWLINE = re.compile(b"\n")
+
+# Part of the window at each edge that triggers loading a new window around the view.
+_WINDOW_MARGIN = 0.2
+
+
+class FileViewer(ScrolledText):
+    """
+    A read-only viewer for large files, built on ScrolledText.
+
+    The file is memory-mapped and only a window of lines around the view is kept in the text widget.
+    A sparse line offset index is built incrementally in the background, and the vertical scrollbar
+    reflects the position of the view in the whole file rather than in the loaded window. Opening a
+    file is near-instant and memory usage does not depend on the file size.
+
+    Args:
+        master: Parent widget container.
+        path: File to open (default: None).
+        encoding (str): Encoding of the file, undecodable bytes are replaced. Lines are found by searching
+            the bytes for a newline, so the encoding must encode a newline as the single byte 0x0A, e.g.
+            UTF-8 or Latin-1 but not UTF-16 or UTF-32 (default: "utf-8").
+        window_lines (int): Number of lines kept in the text widget (default: 1000).
+        index_time_budget (float): Time in seconds each indexing slice may take (default: 0.008).
+        **kwargs: Additional arguments passed to ScrolledText, `wrap` defaults to "none".
+    """
+
+    def __init__(
+        self,
+        master: Optional[Misc] = None,
+        path: Union[str, "os.PathLike[str]", None] = None,
+        *,
+        encoding: str = "utf-8",
+        window_lines: int = 1000,
+        index_time_budget: float = 0.008,
+        **kwargs,
+    ):
+        if "\n".encode(encoding) != b"\n":
+            raise ValueError(f"Encoding {encoding!r} does not encode newlines as a single 0x0A byte")
+        self.__encoding = encoding
+        self.__window_lines = max(window_lines, 100)
+        self.__index_time_budget = index_time_budget
+        self.__file: Optional[BinaryIO] = None
+        self.__mmap: Optional[mmap.mmap] = None
+        self.__size = 0
+        self.__checkpoints = array("Q", [0])
+        self.__newline_count = 0
+        self.__index_position = 0
+        self.__index_task_id: Optional[str] = None
+        self.__window_start = 0
+        self.__window_count = 0
+        self.__shift_task_id: Optional[str] = None
+
+        kwargs.setdefault("wrap", "none")
+        kwargs["vertical"] = True
+        super().__init__(master, **kwargs)
+        self.configure(state="disabled")
+        if path is not None:
+            self.open(path)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines of the file, estimated from the indexed part until indexing is complete."""
+        if self.indexing_complete:
+            trailing_line = self.__size > 0 and self.__read(self.__size - 1, self.__size) != b"\n"
+            return self.__newline_count + trailing_line
+        return max(self.__newline_count * self.__size // max(self.__index_position, 1), self.__newline_count + 1)
+
+    @property
+    def indexing_complete(self) -> bool:
+        return self.__index_position >= self.__size
+
+    @property
+    def window_start(self) -> int:
+        """Line number (0-based) of the first line loaded into the text widget."""
+        return self.__window_start
+
+    def open(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Open a file, replacing the current one."""
+        self.close()
+        self.__file = open(path, "rb")  # noqa: SIM115, PTH123
+        self.__size = os.fstat(self.__file.fileno()).st_size
+        if self.__size:  # Empty files cannot be mapped
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__load_window(0)
+        self.yview_moveto(0)
+        self.__index_task_id = self.after_idle(self.__index_step)
+
+    def close(self) -> None:
+        """Close the current file and clear the text."""
+        for task_id in (self.__index_task_id, self.__shift_task_id):
+            if task_id is not None:
+                self.after_cancel(task_id)
+        self.__index_task_id = self.__shift_task_id = None
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        self.__size = 0
+        self.__checkpoints = array("Q", [0])
+        self.__newline_count = 0
+        self.__index_position = 0
+        self.__set_window_text(0, "")
+
+    def destroy(self) -> None:
+        self.close()
+        super().destroy()
+
+    def see_line(self, line: int) -> None:
+        """Scroll the view so the line (0-based) of the file is at the top."""
+        line = max(0, min(line, self.__known_line_count() - 1))
+        visible = self.__visible_line_count()
+        window_end = self.__window_start + self.__window_count
+        if not (self.__window_start <= line and line + visible <= window_end):
+            self.__load_window(max(0, line - self.__window_lines // 2))
+        self.yview(f"{line - self.__window_start + 1}.0")
+
+    def _create_vertical_scrollbar(self):
+        super()._create_vertical_scrollbar()
+        self.configure(yscrollcommand=self.__on_yscroll)
+        if self.vbar is not None:
+            self.vbar.configure(command=self.__on_scrollbar)
+
+    def __read(self, start: int, end: int) -> bytes:
+        return self.__mmap[start:end] if self.__mmap is not None else b""
+
+    def __known_line_count(self) -> int:
+        return self.line_count if self.indexing_complete else self.__newline_count + 1
+
+    def __line_offset(self, line: int) -> int:
+        """Return the byte offset of a line (0-based), scanning from the closest indexed line."""
+        if self.__mmap is None:
+            return 0
+        checkpoint = min(line // _INDEX_STRIDE, len(self.__checkpoints) - 1)
+        offset = self.__checkpoints[checkpoint]
+        for _ in range(line - checkpoint * _INDEX_STRIDE):
+            offset = self.__mmap.find(b"\n", offset) + 1
+            if offset == 0:
+                return self.__size
+        return offset
+
+    def __index_step(self) -> None:
+        self.__index_task_id = None
+        if self.__mmap is None:
+            return
+        deadline = perf_counter() + self.__index_time_budget
+        while self.__index_position < self.__size and perf_counter() < deadline:
+            start = self.__index_position
+            chunk = self.__mmap[start : start + _INDEX_CHUNK_SIZE]
+            # Record the offset after each newline that completes a stride.
+            first = -(self.__newline_count + 1) % _INDEX_STRIDE
+            self.__checkpoints.extend(
+                start + match.end() for match in islice(_NEWLINE.finditer(chunk), first, None, _INDEX_STRIDE)
+            )
+            self.__newline_count += chunk.count(b"\n")
+            self.__index_position = start + len(chunk)
+        self.__update_scrollbar()
+        if not self.indexing_complete:
+            self.__index_task_id = self.after(1, self.__index_step)
+
+    def __set_window_text(self, start: int, data: str) -> None:
+        self.configure(state="normal")
+        self.delete("1.0", "end")
+        self.insert("1.0", data)
+        self.configure(state="disabled")
+        self.__window_start = start
+        self.__window_count = data.count("\n") + 1 if data else 0
+
+    def __load_window(self, start: int) -> None:
+        start_offset = self.__line_offset(start)
+        end_offset = self.__line_offset(start + self.__window_lines)
+        data = self.__read(start_offset, end_offset).decode(self.__encoding, errors="replace")
+        data = data.replace("\r\n", "\n")
+        if data.endswith("\n"):
+            data = data[:-1]
+        self.__set_window_text(start, data)
+
+    def __visible_line_count(self) -> int:
+        first, last = self.yview()
+        return max(1, round((last - first) * self.__window_count))
+
+    def __first_visible_line(self) -> int:
+        return self.__window_start + int(self.index("@0,0").split(".")[0]) - 1
+
+    def __update_scrollbar(self, first: Optional[float] = None, last: Optional[float] = None) -> None:
+        if self.vbar is None:
+            return
+        if first is None or last is None:
+            first, last = self.yview()
+        total = self.line_count
+        if total <= 0:
+            self.vbar.set(0, 1)
+            return
+        top = self.__window_start + first * self.__window_count
+        bottom = self.__window_start + last * self.__window_count
+        self.vbar.set(min(top / total, 1), min(bottom / total, 1))
+
+    def __on_yscroll(self, first: Union[float, str], last: Union[float, str]) -> None:
+        first_fraction, last_fraction = float(first), float(last)
+        self.__update_scrollbar(first_fraction, last_fraction)
+        window_end = self.__window_start + self.__window_count
+        near_top = first_fraction < _WINDOW_MARGIN and self.__window_start > 0
+        near_bottom = last_fraction > 1 - _WINDOW_MARGIN and window_end < self.__known_line_count()
+        if (near_top or near_bottom) and self.__shift_task_id is None:
+            # Never reload the text from within the scroll callback of the text itself.
+            self.__shift_task_id = self.after_idle(self.__shift_window)
+
+    def __shift_window(self) -> None:
+        self.__shift_task_id = None
+        line = self.__first_visible_line()
+        self.__load_window(max(0, line - self.__window_lines // 2))
+        self.yview(f"{line - self.__window_start + 1}.0")
+
+    def __on_scrollbar(self, *args: str) -> None:
+        if args and args[0] == "moveto":
+            self.see_line(int(float(args[1]) * self.line_count))
+        else:
+            self.yview(*args)
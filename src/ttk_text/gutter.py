@@ -0,0 +1,207 @@
+from contextlib import suppress
+from tkinter import Canvas, Event, TclError
+from typing import Any, List, Optional, Tuple
+
+from ttk_text import _TRANSITION_STATE_EVENTS, ThemedText
+from ttk_text._journal import LineChange
+from ttk_text._throttle import chained_command, throttled_command
+from ttk_text._utils import unbind_funcid
+
+__all__ = ["LineNumberGutter"]
+
+
+class LineNumberGutter(Canvas):
+    """
+    A line number gutter placed in the free column on the left of a ThemedText.
+
+    Only the lines in the view are drawn, from their ``dlineinfo`` positions, and the canvas items
+    of the previous draw are reused, so the cost does not depend on the document size. The gutter is
+    redrawn when the view scrolls, through the chained ``yscrollcommand`` of the text whose Python hook
+    is throttled to once per frame, and when the edit journal reports a change above the end of the view.
+
+    The gutter is bound to the frame with ``penetration_state=True``. Its font and colours are looked
+    up from the substyle ``substyle`` of the frame style in the current frame state, falling back to
+    the frame style, so it follows the focus and hover styling and theme changes.
+
+    Example:
+        .. code-block:: python
+
+            style.configure("LineNumber.ThemedText.TEntry", foreground="gray")
+            text = ScrolledText(root)
+            gutter = LineNumberGutter(text)
+
+    .. note::
+        The ``yscrollcommand`` of the text must be configured before creating the gutter, it is restored
+        when the gutter is destroyed.
+    """
+
+    def __init__(self, text: ThemedText, *, substyle: str = "LineNumber", padding: int = 4, **kwargs):
+        """
+        Create the gutter and place it in column 0 of the frame of the text.
+
+        :param text: Text widget whose lines are numbered
+        :param substyle: Prefix of the style the font and colours are looked up from
+        :param padding: Horizontal space in pixels on each side of the numbers
+        :param kwargs: Additional Canvas configuration options
+        """
+        kwargs.setdefault("borderwidth", 0)
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("takefocus", False)
+        super().__init__(text.frame, width=0, **kwargs)
+        self.__text = text
+        self.__substyle = substyle
+        self.__padding = padding
+        self.__font = ""
+        self.__ascent = 0
+        self.__digits = 0
+        # Canvas items of the drawn rows and what they display, reused by the next draw.
+        self.__items: List[int] = []
+        self.__drawn: List[Optional[Tuple[str, float]]] = []
+        self.__redraw_task_id: Optional[str] = None
+        self.__restyle_task_id: Optional[str] = None
+        self.__destroyed = False
+
+        self.grid(row=1, column=0, sticky="ns")
+        text.frame.bind_widget(self, penetration_state=True)
+
+        self.__previous_yscrollcommand = str(text.cget("yscrollcommand"))
+        # The previous command is called from Tcl, only the coalesced redraw trigger enters Python.
+        hook = throttled_command(self, self.register(self.__on_yscroll))
+        if self.__previous_yscrollcommand:
+            hook = chained_command(self, self.__previous_yscrollcommand, hook)
+        text.configure(yscrollcommand=hook)
+        text.subscribe_changes(self.__on_change)
+        # The frame state changes on these events, the gutter is restyled once they are handled.
+        self.__bindings = [
+            (widget, sequence, widget.bind(sequence, self.__on_state_event, "+"))
+            for widget in (text, text.frame)
+            for sequence in _TRANSITION_STATE_EVENTS
+        ]
+        self.__bindings.append((text, "<Configure>", text.bind("<Configure>", self.__on_configure, "+")))
+        for sequence in _TRANSITION_STATE_EVENTS:
+            self.bind(sequence, self.__on_state_event, "+")
+        self.bind("<<ThemeChanged>>", self.__on_state_event, "+")
+        self.bind("<Configure>", self.__on_configure, "+")
+        self.__restyle()
+
+    def destroy(self) -> None:
+        """Destroy the gutter, restoring the ``yscrollcommand`` of the text and removing its bindings."""
+        if self.__destroyed:
+            return
+        self.__destroyed = True
+        text = self.__text
+        with suppress(ValueError):
+            text.unsubscribe_changes(self.__on_change)
+        for widget, sequence, funcid in self.__bindings:
+            if widget.winfo_exists():
+                unbind_funcid(widget, sequence, funcid)
+        if text.winfo_exists():
+            with suppress(TclError):
+                text.configure(yscrollcommand=self.__previous_yscrollcommand)
+        for task_id in (self.__redraw_task_id, self.__restyle_task_id):
+            if task_id is not None:
+                self.after_cancel(task_id)
+        super().destroy()
+
+    def redraw(self) -> None:
+        """Draw the numbers of the lines in the view now."""
+        if self.__redraw_task_id is not None:
+            self.after_cancel(self.__redraw_task_id)
+            self.__redraw_task_id = None
+        text = self.__text
+        line_count = int(text.index("end-1c").split(".")[0])
+        self.__resize(len(str(line_count)))
+
+        # dlineinfo is relative to the text, the gutter may be placed lower when the text has padding.
+        offset = text.winfo_y() - self.winfo_y()
+        x = int(self.cget("width")) - self.__padding
+        rows = []
+        line = int(text.index("@0,0").split(".")[0])
+        while line <= line_count:
+            info = text.dlineinfo(f"{line}.0")
+            if info is None:
+                break
+            rows.append((str(line), offset + info[1] + info[4] - self.__ascent))
+            line += 1
+
+        for row, drawn in enumerate(rows):
+            if row == len(self.__items):
+                item = self.create_text(x, 0, anchor="ne", font=self.__font, fill=self.__fill(self.__state()))
+                self.__items.append(item)
+                self.__drawn.append(None)
+            if self.__drawn[row] != drawn:
+                item = self.__items[row]
+                if self.__drawn[row] is None:
+                    self.itemconfigure(item, state="normal")
+                self.itemconfigure(item, text=drawn[0])
+                self.coords(item, x, drawn[1])
+                self.__drawn[row] = drawn
+        for row in range(len(rows), len(self.__items)):
+            if self.__drawn[row] is not None:
+                self.itemconfigure(self.__items[row], state="hidden")
+                self.__drawn[row] = None
+
+    def __schedule_redraw(self) -> None:
+        if self.__redraw_task_id is None:
+            self.__redraw_task_id = self.after_idle(self.redraw)
+
+    def __on_yscroll(self, *_: Any) -> None:
+        self.__schedule_redraw()
+
+    def __on_change(self, change: LineChange) -> None:
+        if change.new_last != change.old_last:
+            self.__schedule_redraw()
+            return
+        # Edits within a line can change how the following lines wrap.
+        bottom = int(self.__text.index(f"@0,{self.__text.winfo_height()}").split(".")[0])
+        if change.first <= bottom:
+            self.__schedule_redraw()
+
+    def __on_configure(self, _: Event) -> None:
+        self.__schedule_redraw()
+
+    def __on_state_event(self, _: Event) -> None:
+        if self.__restyle_task_id is None:
+            self.__restyle_task_id = self.after_idle(self.__restyle)
+
+    def __state(self) -> Tuple[str, ...]:
+        return tuple(map(str, self.__text.frame.state()))
+
+    def __fill(self, state: Tuple[str, ...]) -> str:
+        return self.__text.frame.lookup(
+            "foreground",
+            state=state,
+            substyle=self.__substyle,
+            default=self.__text.cget("foreground"),
+        )
+
+    def __restyle(self) -> None:
+        self.__restyle_task_id = None
+        frame = self.__text.frame
+        state = self.__state()
+        font = frame.lookup("font", substyle=self.__substyle, default="TkDefaultFont")
+        background = frame.lookup(
+            "fieldbackground",
+            state=state,
+            substyle=self.__substyle,
+            default=self.__text.cget("background"),
+        )
+        self.configure(background=background)
+        self.itemconfigure("all", fill=self.__fill(state))
+        if font != self.__font:
+            self.__font = font
+            self.__ascent = int(self.tk.call("font", "metrics", font, "-ascent"))
+            self.itemconfigure("all", font=font)
+            self.__digits = 0  # Measure the width again
+            self.__drawn = [None] * len(self.__items)
+            self.itemconfigure("all", state="hidden")
+            self.__schedule_redraw()
+
+    def __resize(self, digits: int) -> None:
+        if digits == self.__digits:
+            return
+        self.__digits = digits
+        width = int(self.tk.call("font", "measure", self.__font, "0" * digits)) + 2 * self.__padding
+        self.configure(width=width)
+        self.__drawn = [None] * len(self.__items)
+        self.itemconfigure("all", state="hidden")
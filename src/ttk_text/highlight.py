@@ -0,0 +1,301 @@
+import re
+from bisect import insort
+from time import perf_counter
+from tkinter import Event
+from typing import Dict, Hashable, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+from ttk_text import ThemedText
+from ttk_text._journal import LineChange
+from ttk_text._tags import apply_tag_ranges
+from ttk_text._utils import unbind_funcid
+
+__all__ = ["Highlighter", "Lexer", "RegexLexer", "Token"]
+
+# A token of a line: start column, end column and token name.
+Token = Tuple[int, int, str]
+
+# Start state of a line that has not been lexed since it changed.
+_UNKNOWN = object()
+
+# Number of lines read from the text with a single call.
+_LINE_BATCH_SIZE = 256
+
+# Tag options set from the style options of the token substyles.
+_TAG_STYLE_OPTIONS = (("foreground", "foreground"), ("background", "fieldbackground"))
+
+
+class Lexer(Protocol):
+    """
+    A line-based lexer.
+
+    The state carries everything a line needs to know about the lines before it, such as being inside
+    a block comment. States must be comparable, the highlighter stops re-lexing after an edit as soon
+    as a line ends in the same state as before.
+    """
+
+    initial_state: Hashable
+
+    def lex_line(self, line: str, state: Hashable) -> Tuple[Iterable[Token], Hashable]:
+        """
+        Lex a line.
+
+        :param line: Text of the line, without the newline
+        :param state: State at the start of the line
+        :return: The tokens of the line and the state at the end of the line
+        """
+        ...
+
+
+class RegexLexer:
+    r"""
+    A stateless lexer matching regular expressions, the first matching rule wins.
+
+    Example:
+        .. code-block:: python
+
+            lexer = RegexLexer([("Comment", r"#.*"), ("String", r"'[^']*'"), ("Keyword", r"\b(?:def|return)\b")])
+    """
+
+    initial_state: Hashable = None
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], *, flags: int = 0):
+        """
+        Compile the rules into a single pattern.
+
+        :param rules: (token, pattern) pairs
+        :param flags: Flags used to compile the patterns
+        """
+        self.__tokens = {f"t{number}": token for number, (token, _) in enumerate(rules)}
+        self.__pattern = re.compile(
+            "|".join(f"(?P<t{number}>{pattern})" for number, (_, pattern) in enumerate(rules)),
+            flags,
+        )
+
+    def lex_line(self, line: str, state: Hashable) -> Tuple[Iterable[Token], Hashable]:
+        tokens = [
+            (match.start(), match.end(), self.__tokens[match.lastgroup])
+            for match in self.__pattern.finditer(line)
+            if match.lastgroup is not None and match.end() > match.start()
+        ]
+        return tokens, state
+
+
+class Highlighter:
+    r"""
+    Highlight a text widget incrementally with a pluggable line-based lexer.
+
+    The lexer state at the start of each line is kept. After an edit, lines are lexed again from the
+    first changed line until a line past the change ends in the same state as before, so typing on a
+    line usually lexes only that line. Work is done in time-sliced event loop callbacks; when the
+    lines to lex start above the view, the visible lines are highlighted first from the closest known
+    state, then corrected by the regular pass.
+
+    Tokens are highlighted with the tag ``tag_prefix + token``. Its colours are looked up from the
+    substyle ``token`` of the frame style, e.g. "Keyword.ThemedText.TEntry", and follow theme changes.
+    Options that do not differ from the frame style are left unset.
+
+    Example:
+        .. code-block:: python
+
+            style.configure("Keyword.ThemedText.TEntry", foreground="blue")
+            highlighter = Highlighter(text, RegexLexer([("Keyword", r"\b(?:def|return)\b")]))
+
+    :ivar lexed_lines: Number of lines lexed so far
+    """
+
+    def __init__(
+        self,
+        text: ThemedText,
+        lexer: Lexer,
+        *,
+        time_budget: float = 0.008,
+        tag_prefix: str = "token.",
+    ):
+        """
+        Start highlighting a text widget.
+
+        :param text: Text widget to highlight
+        :param lexer: Lexer of the text
+        :param time_budget: Time in seconds each slice may spend lexing
+        :param tag_prefix: Prefix of the token tag names
+        """
+        self.__text = text
+        self.__lexer = lexer
+        self.__time_budget = time_budget
+        self.__tag_prefix = tag_prefix
+        self.__tags: Dict[str, str] = {}
+        self.__states: List[Hashable] = []
+        # Disjoint ranges of lines to lex, sorted by their first line.
+        self.__dirty: List[Tuple[int, int]] = []
+        self.__provisional: Optional[Tuple[int, int]] = None
+        self.__task_id: Optional[str] = None
+        self.__restyle_task_id: Optional[str] = None
+        self.lexed_lines = 0
+
+        text.subscribe_changes(self.__on_change)
+        self.__theme_funcid = text.bind("<<ThemeChanged>>", self.__on_theme_changed, "+")
+        self.highlight()
+
+    @property
+    def running(self) -> bool:
+        """Whether some lines are waiting to be lexed."""
+        return bool(self.__dirty)
+
+    def highlight(self) -> None:
+        """Lex the whole text again, e.g. after the lexer was reconfigured."""
+        self.__reset(self.__line_count())
+        self.__schedule()
+
+    def close(self) -> None:
+        """Stop highlighting, the token tags are removed."""
+        self.__text.unsubscribe_changes(self.__on_change)
+        unbind_funcid(self.__text, "<<ThemeChanged>>", self.__theme_funcid)
+        for task_id in (self.__task_id, self.__restyle_task_id):
+            if task_id is not None:
+                self.__text.after_cancel(task_id)
+        self.__task_id = self.__restyle_task_id = None
+        self.__dirty = []
+        for tag in self.__tags.values():
+            self.__text.tag_delete(tag)
+        self.__tags.clear()
+
+    def __line_count(self) -> int:
+        return int(self.__text.index("end-1c").split(".")[0])
+
+    def __reset(self, line_count: int) -> None:
+        self.__states = [self.__lexer.initial_state, *([_UNKNOWN] * (line_count - 1))]
+        self.__dirty = [(1, line_count)]
+        self.__provisional = None
+
+    def __schedule(self) -> None:
+        if self.__task_id is None:
+            self.__task_id = self.__text.after_idle(self.__step)
+
+    def __on_change(self, change: LineChange) -> None:
+        first, old_last, new_last = change
+        # The start state of the first line is kept, the end state of the last line is kept to detect convergence.
+        self.__states[first:old_last] = [_UNKNOWN] * (new_last - first)
+        # Ranges overlapping the change are merged with it, the ranges after it are shifted.
+        shift = new_last - old_last
+        dirty = []
+        merged = (first, new_last)
+        for dirty_first, dirty_last in self.__dirty:
+            if dirty_last < first:
+                dirty.append((dirty_first, dirty_last))
+            elif dirty_first > old_last:
+                dirty.append((dirty_first + shift, dirty_last + shift))
+            else:
+                merged = (min(merged[0], dirty_first), max(merged[1], dirty_last + shift))
+        insort(dirty, merged)
+        self.__dirty = dirty
+        self.__provisional = None
+        self.__schedule()
+
+    def __on_theme_changed(self, _: Event) -> None:
+        if self.__restyle_task_id is None:
+            self.__restyle_task_id = self.__text.after_idle(self.__restyle)
+
+    def __restyle(self) -> None:
+        self.__restyle_task_id = None
+        for token, tag in self.__tags.items():
+            self.__configure_tag(token, tag)
+
+    def __configure_tag(self, token: str, tag: str) -> None:
+        frame = self.__text.frame
+        options = {}
+        for tag_option, style_option in _TAG_STYLE_OPTIONS:
+            value = frame.lookup(style_option, substyle=token, default="")
+            options[tag_option] = "" if value == frame.lookup(style_option, default="") else value
+        self.__text.tag_configure(tag, **options)
+
+    def __tag(self, token: str) -> str:
+        tag = self.__tags.get(token)
+        if tag is None:
+            tag = self.__tags[token] = f"{self.__tag_prefix}{token}"
+            self.__configure_tag(token, tag)
+            self.__text.tag_lower(tag, "sel")
+        return tag
+
+    def __lex_line(self, line: int, chars: str, state: Hashable, ranges: Dict[str, List[str]]) -> Hashable:
+        tokens, state = self.__lexer.lex_line(chars, state)
+        for start, end, token in tokens:
+            ranges.setdefault(self.__tag(token), []).extend((f"{line}.{start}", f"{line}.{end}"))
+        self.lexed_lines += 1
+        return state
+
+    def __apply(self, first: int, last: int, ranges: Dict[str, List[str]]) -> None:
+        if first > last:
+            return
+        cleared = (f"{first}.0", f"{last}.end")
+        apply_tag_ranges(self.__text, "remove", dict.fromkeys(self.__tags.values(), cleared))
+        apply_tag_ranges(self.__text, "add", ranges)
+
+    def __visible_lines(self) -> Tuple[int, int]:
+        top = self.__text.index("@0,0")
+        bottom = self.__text.index(f"@0,{self.__text.winfo_height()}")
+        return int(top.split(".")[0]), int(bottom.split(".")[0])
+
+    def __highlight_visible(self, dirty_first: int, dirty_last: int) -> None:
+        """Highlight the changed visible lines below the first line to lex, from the closest known state."""
+        top, bottom = self.__visible_lines()
+        first, last = max(top, dirty_first + 1), min(bottom, dirty_last)
+        if first > last or (first, last) == self.__provisional:
+            return
+        self.__provisional = (first, last)
+        known = first - 1
+        while self.__states[known] is _UNKNOWN:
+            known -= 1
+        state = self.__states[known]
+        ranges: Dict[str, List[str]] = {}
+        for line, chars in enumerate(self.__text.get(f"{first}.0", f"{last}.end").split("\n"), first):
+            state = self.__lex_line(line, chars, state, ranges)
+        self.__apply(first, last, ranges)
+
+    def __merge_reached(self, line: int, dirty_last: int) -> int:
+        """Merge the next dirty range into the one being lexed once it is reached, return the new last line."""
+        if len(self.__dirty) > 1 and line >= self.__dirty[1][0]:
+            return max(dirty_last, self.__dirty.pop(1)[1])
+        return dirty_last
+
+    def __step(self) -> None:
+        self.__task_id = None
+        # Pending edits are delivered first, so the line numbers match the kept states.
+        self.__text.edit_journal.flush()
+        line_count = self.__line_count()
+        if len(self.__states) != line_count:
+            self.__reset(line_count)
+        if not self.__dirty:
+            return
+        deadline = perf_counter() + self.__time_budget
+        first, dirty_last = self.__dirty[0]
+        self.__highlight_visible(first, dirty_last)
+
+        ranges: Dict[str, List[str]] = {}
+        line = first
+        state = self.__states[first - 1]
+        done = False
+        while not done:
+            batch_last = min(line + _LINE_BATCH_SIZE - 1, line_count)
+            for chars in self.__text.get(f"{line}.0", f"{batch_last}.end").split("\n"):
+                state = self.__lex_line(line, chars, state, ranges)
+                line += 1
+                dirty_last = self.__merge_reached(line, dirty_last)
+                if line > line_count or (line > dirty_last and self.__states[line - 1] == state):
+                    done = True
+                    break
+                self.__states[line - 1] = state
+                if perf_counter() >= deadline:
+                    break
+            if perf_counter() >= deadline:
+                break
+        self.__apply(first, line - 1, ranges)
+
+        if done:
+            del self.__dirty[0]
+            self.__provisional = None
+            if not self.__dirty:
+                return
+        else:
+            self.__dirty[0] = (line, dirty_last)
+        # A short timer instead of an idle callback lets pending redraws run between slices.
+        self.__task_id = self.__text.after(1, self.__step)
@@ -0,0 +1,183 @@
+"""
+Counters, timers and span hooks of ttk-text, to find out whether it is responsible for UI stutters.
+
+Instrumentation is disabled by default. Instrumented code only checks the module-level ``enabled``
+flag, so it costs an attribute lookup when disabled.
+
+Example:
+    .. code-block:: python
+
+        from ttk_text import instrumentation
+
+        instrumentation.enable(hook=lambda span: print(span.name, span.duration))
+        ...
+        for name, stat in instrumentation.stats().items():
+            print(f"{name}: {stat.calls} calls, {stat.total * 1000:.1f} ms")
+
+Recorded names:
+    - ``update_style``: Full style updates of a frame (timed)
+    - ``stateful_style_update``: Stateful style updates of a frame (timed)
+    - ``style_update_merged``: Stateful style update requests merged into a pending one (debounced)
+    - ``style_update_flush``: Flushes of the pending stateful style updates (timed, global)
+    - ``theme_restyle``: Passes re-styling every frame after a theme change (timed, global)
+    - ``style_lookup``: Style lookups forwarded to Tcl (timed, global)
+    - ``style_lookup_hit``: Style lookups answered by the cache (global)
+    - ``configure``: Configure and grid calls applied to a frame or its text (timed)
+    - ``configure_skipped``: Configure and grid calls skipped because nothing changed
+"""
+
+from time import perf_counter
+from tkinter import Misc
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+__all__ = [
+    "Span",
+    "Stat",
+    "disable",
+    "enable",
+    "interpreter_counters",
+    "is_enabled",
+    "reset",
+    "set_span_hook",
+    "stats",
+]
+
+enabled = False
+
+
+class Stat(NamedTuple):
+    """
+    Statistics of a recorded name.
+
+    :ivar calls: Number of recorded events
+    :ivar total: Total duration of the timed events in seconds
+    :ivar max: Longest duration of a timed event in seconds
+    """
+
+    calls: int
+    total: float
+    max: float
+
+
+class Span(NamedTuple):
+    """
+    A timed operation, passed to the span hook.
+
+    :ivar name: Recorded name
+    :ivar start: Start time, from ``time.perf_counter``
+    :ivar duration: Duration in seconds
+    :ivar owner: Frame the operation belongs to, None for interpreter-wide operations
+    """
+
+    name: str
+    start: float
+    duration: float
+    owner: Optional[Misc]
+
+
+# Mutable [calls, total, max] lists, converted to Stat when read.
+_global_stats: Dict[str, List[Any]] = {}
+_owner_stats: "MutableMapping[Misc, Dict[str, List[Any]]]" = WeakKeyDictionary()
+_span_hook: Optional[Callable[[Span], None]] = None
+
+
+def enable(hook: Optional[Callable[[Span], None]] = None) -> None:
+    """
+    Start recording.
+
+    :param hook: Optional callback receiving every timed span, e.g. to forward it to a tracing system
+    """
+    global enabled  # noqa: PLW0603
+    enabled = True
+    if hook is not None:
+        set_span_hook(hook)
+
+
+def is_enabled() -> bool:
+    return enabled
+
+
+def disable() -> None:
+    """Stop recording, the statistics are kept."""
+    global enabled  # noqa: PLW0603
+    enabled = False
+
+
+def set_span_hook(hook: Optional[Callable[[Span], None]]) -> None:
+    """Set the callback receiving every timed span while recording, None to remove it."""
+    global _span_hook  # noqa: PLW0603
+    _span_hook = hook
+
+
+def reset() -> None:
+    """Clear all statistics."""
+    _global_stats.clear()
+    _owner_stats.clear()
+
+
+def stats(owner: Optional[Misc] = None) -> Dict[str, Stat]:
+    """
+    Return the statistics recorded so far.
+
+    :param owner: Frame whose statistics are returned, None for the statistics of all frames
+    """
+    recorded = _global_stats if owner is None else _owner_stats.get(owner, {})
+    return {name: Stat(*values) for name, values in recorded.items()}
+
+
+def interpreter_counters(widget: Misc) -> Dict[str, float]:
+    """
+    Return the counters that are always maintained by the shared objects of the widget's interpreter.
+
+    They are counted whether or not recording is enabled: the style lookup cache, the stateful style
+    update scheduler and the theme change coordinator.
+    """
+    from ttk_text._scheduler import StyleUpdateScheduler, ThemeChangeCoordinator
+    from ttk_text._style import StyleLookupCache
+
+    cache = StyleLookupCache.of(widget)
+    scheduler = StyleUpdateScheduler.of(widget)
+    coordinator = ThemeChangeCoordinator.of(widget)
+    return {
+        "style_cache_hits": cache.hits,
+        "style_cache_misses": cache.misses,
+        "style_cache_generation": cache.generation,
+        "style_update_requests": scheduler.requests,
+        "style_update_merged": scheduler.merged,
+        "style_update_flushes": scheduler.flushes,
+        "style_update_flushed_updates": scheduler.flushed_updates,
+        "theme_restyle_last_frame_count": coordinator.last_frame_count,
+        "theme_restyle_last_duration": coordinator.last_duration,
+        "theme_restyle_total_duration": coordinator.total_duration,
+    }
+
+
+def _add(recorded: Dict[str, List[Any]], name: str, duration: float) -> None:
+    values = recorded.get(name)
+    if values is None:
+        recorded[name] = [1, duration, duration]
+        return
+    values[0] += 1
+    values[1] += duration
+    values[2] = max(values[2], duration)
+
+
+def count(name: str, owner: Optional[Misc] = None) -> None:
+    """Record an untimed event, callers check ``enabled`` first."""
+    _add(_global_stats, name, 0.0)
+    if owner is not None:
+        _add(_owner_stats.setdefault(owner, {}), name, 0.0)
+
+
+def record(name: str, start: float, owner: Optional[Misc] = None) -> None:
+    """Record a timed event that started at ``start``, callers check ``enabled`` first."""
+    duration = perf_counter() - start
+    _add(_global_stats, name, duration)
+    if owner is not None:
+        _add(_owner_stats.setdefault(owner, {}), name, duration)
+    if _span_hook is not None:
+        _span_hook(Span(name, start, duration, owner))
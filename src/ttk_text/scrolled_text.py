@@ -1,8 +1,12 @@
+from functools import partial
 from tkinter import Misc
 from tkinter.ttk import Frame, Scrollbar
-from typing import Optional
+from typing import Callable, List, Literal, Optional, Tuple, Union
 
 from ttk_text import ThemedText
+from ttk_text._autohide import AutoScrollbar
+from ttk_text._stream import Tags, insert_batch
+from ttk_text._throttle import FRAME_INTERVAL, throttled_command, throttled_set_command
 
 __all__ = ["ScrolledText"]
 
@@ -17,8 +21,14 @@ class ScrolledText(ThemedText):
 
     Args:
         master: Parent widget container.
-        vertical (bool): Whether to enable the vertical scrollbar (default: True).
-        horizontal (bool): Whether to enable the horizontal scrollbar (default: False).
+        vertical (Union[bool, "auto"]): Whether to enable the vertical scrollbar, "auto" shows it only
+            when the content does not fit (default: True).
+        horizontal (Union[bool, "auto"]): Whether to enable the horizontal scrollbar, "auto" shows it
+            only when the content does not fit (default: False).
+        max_lines (Optional[int]): Maximum number of lines kept by `append`, oldest lines are trimmed
+            in batches (default: None, unlimited).
+        throttle_scrollbars (bool): Apply scroll command updates to the scrollbars at most once per
+            frame, only the latest position is applied (default: False).
         **kwargs: Additional arguments passed to ThemedText.
 
     Attributes:
@@ -27,8 +37,27 @@ class ScrolledText(ThemedText):
         corner (Frame): Corner frame for the scrollbars (exists when vertical=True and horizontal=True).
     """
 
-    def __init__(self, master: Optional[Misc] = None, *, vertical: bool = True, horizontal: bool = False, **kwargs):
+    def __init__(
+        self,
+        master: Optional[Misc] = None,
+        *,
+        vertical: Union[bool, Literal["auto"]] = True,
+        horizontal: Union[bool, Literal["auto"]] = False,
+        max_lines: Optional[int] = None,
+        throttle_scrollbars: bool = False,
+        **kwargs,
+    ):
         super().__init__(master, **kwargs)
+        self.max_lines = max_lines
+        self.__throttle_scrollbars = throttle_scrollbars
+        self.__auto_orients = {
+            orient for orient, mode in (("vertical", vertical), ("horizontal", horizontal)) if mode == "auto"
+        }
+        self.__auto_scrollbars: List[AutoScrollbar] = []
+        self.__layout_task_id: Optional[str] = None
+        self.__layout_generation = 0
+        self.__pending_appends: List[Tuple[str, Tags]] = []
+        self.__append_task_id: Optional[str] = None
         self.vbar: Optional[Scrollbar] = None
         self.hbar: Optional[Scrollbar] = None
         if vertical:
@@ -38,23 +67,122 @@ class ScrolledText(ThemedText):
         if vertical and horizontal:
             self._create_corner()
 
+    def append(self, chars: str, tags: Tags = ()) -> None:
+        """
+        Append text at the end, for using the widget as a log console.
+
+        Appends are coalesced and inserted once per idle cycle, even when the text is disabled.
+        The view follows the new output only if it was scrolled to the bottom.
+        If ``max_lines`` is set, the oldest lines are trimmed in batches of a tenth of it.
+
+        :param chars: Text to append
+        :param tags: Tags of the appended text
+        """
+        self.__pending_appends.append((chars, tags))
+        if self.__append_task_id is None:
+            self.__append_task_id = self.after_idle(self.flush_appends)
+
+    def flush_appends(self) -> None:
+        """Insert the pending appends now."""
+        if self.__append_task_id is not None:
+            self.after_cancel(self.__append_task_id)
+            self.__append_task_id = None
+        if not self.__pending_appends:
+            return
+
+        # Consecutive appends with the same tags are inserted as a single string.
+        args: List[Union[str, Tags]] = []
+        parts: List[str] = []
+        last_tags: Tags = ()
+        for chars, tags in self.__pending_appends:
+            if parts and tags != last_tags:
+                args.extend(("".join(parts), last_tags))
+                parts = []
+            parts.append(chars)
+            last_tags = tags
+        args.extend(("".join(parts), last_tags))
+        self.__pending_appends.clear()
+
+        follow = self.yview()[1] >= 1.0
+        disabled = str(self.cget("state")) == "disabled"
+        if disabled:
+            self.configure(state="normal")
+        insert_batch(self, "end", args)
+        if self.max_lines is not None:
+            self.__trim_lines(self.max_lines)
+        if disabled:
+            self.configure(state="disabled")
+        if follow:
+            self.yview_moveto(1.0)
+
+    def _insert_sink_batch(self, args: List[Union[str, Tags]]) -> None:
+        for chars, tags in zip(args[::2], args[1::2]):
+            self.append(chars, tags)  # type: ignore[arg-type]
+        self.flush_appends()
+
+    def __trim_lines(self, max_lines: int) -> None:
+        # The last line is the empty line after the final newline of the log.
+        line_count = int(self.index("end-1c").split(".")[0]) - 1
+        if line_count > max_lines:
+            # Trim past the limit, so lines are deleted in batches rather than on each append.
+            excess = line_count - max_lines + max(1, max_lines // 10)
+            self.delete("1.0", f"{min(excess, line_count) + 1}.0")
+
+    def _scroll_command(self, scrollbar: Scrollbar) -> Union[str, Callable[..., None]]:
+        """Return the scroll command of the text updating a scrollbar, throttled if enabled."""
+        if str(scrollbar.cget("orient")) in self.__auto_orients:
+            auto_scrollbar = AutoScrollbar(scrollbar)
+            self.__auto_scrollbars.append(auto_scrollbar)
+            command = partial(self.__on_auto_scroll, auto_scrollbar)
+            if self.__throttle_scrollbars:
+                return throttled_command(self, self.register(command))
+            return command
+        if self.__throttle_scrollbars:
+            return throttled_set_command(scrollbar)
+        return scrollbar.set
+
+    def __on_auto_scroll(self, auto_scrollbar: AutoScrollbar, first: str, last: str) -> None:
+        auto_scrollbar.set(first, last)
+        if auto_scrollbar.pending and self.__layout_task_id is None:
+            # Defer the layout, so the scroll commands of one redraw lead to a single change.
+            self.__layout_task_id = self.after_idle(self.__layout_scrollbars)
+
+    def __layout_scrollbars(self) -> None:
+        self.__layout_task_id = None
+        self.__layout_generation += 1
+        changed = False
+        for auto_scrollbar in self.__auto_scrollbars:
+            changed = auto_scrollbar.apply(self.__layout_generation) or changed
+        corner = getattr(self, "corner", None)
+        if changed and corner is not None:
+            if all(bar.visible for bar in self.__auto_scrollbars):
+                corner.grid()
+            else:
+                corner.grid_remove()
+        if changed or any(bar.pending for bar in self.__auto_scrollbars):
+            # Let the geometry and the scroll commands settle before changing the visibility again, the
+            # next pass runs first as no other one is scheduled while this task is pending.
+            self.__layout_task_id = self.after(FRAME_INTERVAL, self.__layout_scrollbars)
+
     def _create_vertical_scrollbar(self):
         self.vbar = Scrollbar(self.frame, orient="vertical")
         self.vbar.grid(row=1, column=2, sticky="ns")
-        self.configure(yscrollcommand=self.vbar.set)
+        self.configure(yscrollcommand=self._scroll_command(self.vbar))
         self.vbar.configure(command=self.yview)
         self.frame.bind_widget(self.vbar)
 
     def _create_horizontal_scrollbar(self):
         self.hbar = Scrollbar(self.frame, orient="horizontal")
         self.hbar.grid(row=2, column=1, sticky="we")
-        self.configure(xscrollcommand=self.hbar.set)
+        self.configure(xscrollcommand=self._scroll_command(self.hbar))
         self.hbar.configure(command=self.xview)
         self.frame.bind_widget(self.hbar)
 
     def _create_corner(self):
         self.corner = Frame(self.frame)
         self.corner.grid(row=2, column=2, sticky="nswe")
+        if self.__auto_scrollbars:
+            self.corner.grid_remove()
 
 
 def example():
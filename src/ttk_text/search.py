@@ -0,0 +1,200 @@
+import re
+from queue import Empty, SimpleQueue
+from threading import Thread
+from tkinter import Text
+from typing import Callable, List, NamedTuple, Optional, Pattern, Tuple, Union
+
+from ttk_text._tags import apply_tag_ranges
+from ttk_text._utils import line_starts, offsets_to_indices
+
+__all__ = ["TextSearch"]
+
+# Number of matches converted and sent back to the main thread at once.
+_MATCH_BATCH_SIZE = 2048
+_POLL_INTERVAL = 10
+
+
+class _Job(NamedTuple):
+    generation: int
+    first_line: int
+    last_line: Optional[int]
+    line_count: int
+
+
+class TextSearch:
+    """
+    Search a text widget with a regular expression in a worker thread and highlight the matches.
+
+    The text is read with a single ``get`` call, then matched in a worker thread that converts the
+    match offsets to indices in bulk and streams them back in batches. The main thread only applies
+    the highlight tag, with a single Tcl call for all ranges received since the last poll.
+
+    After edits, ``refresh_lines`` re-searches only the changed lines. Matches of incremental searches
+    do not extend beyond the refreshed lines.
+
+    Example:
+        .. code-block:: python
+
+            search = TextSearch(text, r"error|warning", flags=re.IGNORECASE)
+            text.tag_configure(search.tag, background="yellow")
+            search.search()
+
+    :ivar tag: Tag applied to the matches
+    :ivar match_count: Number of matches highlighted by the current search
+    :ivar running: Whether a search is in progress
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        pattern: Union[str, Pattern[str]],
+        *,
+        flags: int = 0,
+        tag: str = "search",
+        on_done: Optional[Callable[[int], None]] = None,
+    ):
+        """
+        Create a search engine for a text widget.
+
+        :param text: Text widget to search
+        :param pattern: Regular expression
+        :param flags: Flags used to compile the pattern if it is a string
+        :param tag: Tag applied to the matches
+        :param on_done: Called with the match count when a search or refresh completes
+        """
+        self.__text = text
+        self.__pattern = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        self.__on_done = on_done
+        self.__results: SimpleQueue[Tuple[int, Optional[List[str]]]] = SimpleQueue()
+        self.__generation = 0
+        self.__job: Optional[_Job] = None
+        self.__dirty: Optional[Tuple[int, int]] = None
+        self.__refresh_task_id: Optional[str] = None
+        self.__poll_task_id: Optional[str] = None
+        # Matches per line (index 0 is line 1), counted at the line where they start. Tk merges
+        # adjacent tag ranges, so the ranges of the tag cannot be counted instead.
+        self.__line_matches: List[int] = []
+        self.tag = tag
+        self.match_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self.__job is not None or self.__refresh_task_id is not None
+
+    def search(self) -> None:
+        """Search the whole text, replacing the previous highlights."""
+        self.cancel()
+        self.match_count = 0
+        self.__line_matches = [0] * self.__line_count()
+        self.__text.tag_remove(self.tag, "1.0", "end")
+        self.__start(1, None)
+
+    def refresh_lines(self, first: int, last: int) -> None:
+        """
+        Search changed lines again, in the next idle cycle.
+
+        Requests are merged, a refresh in progress is restarted with the merged lines.
+
+        :param first: First changed line (1-based), in the current text
+        :param last: Last changed line (inclusive), in the current text
+        """
+        job = self.__job
+        if job is not None:
+            if job.last_line is None:
+                # Positions of a whole text search in progress are outdated, search again.
+                self.search()
+                return
+            self.__generation += 1
+            self.__job = None
+            # Lines may have been inserted or deleted since the refresh started.
+            delta = abs(self.__line_count() - job.line_count)
+            first, last = min(first, job.first_line), max(last, job.last_line + delta)
+        if self.__dirty is not None:
+            first, last = min(first, self.__dirty[0]), max(last, self.__dirty[1])
+        self.__dirty = (first, last)
+        if self.__refresh_task_id is None:
+            self.__refresh_task_id = self.__text.after_idle(self.__refresh)
+
+    def cancel(self) -> None:
+        """Stop the search in progress, highlights already applied are kept."""
+        self.__generation += 1
+        self.__job = None
+        self.__dirty = None
+        for task_id in (self.__refresh_task_id, self.__poll_task_id):
+            if task_id is not None:
+                self.__text.after_cancel(task_id)
+        self.__refresh_task_id = self.__poll_task_id = None
+
+    def __line_count(self) -> int:
+        return int(self.__text.index("end-1c").split(".")[0])
+
+    def __refresh(self) -> None:
+        self.__refresh_task_id = None
+        if self.__dirty is None:
+            return
+        first, last = self.__dirty
+        self.__dirty = None
+        last = min(last, self.__line_count())
+        if first > last:
+            return
+        # The changed lines replace lines first to old_last of the counted lines.
+        old_last = max(first - 1, last - (self.__line_count() - len(self.__line_matches)))
+        # Matches removed here are added back by the worker if they still match.
+        self.match_count -= sum(self.__line_matches[first - 1 : old_last])
+        self.__line_matches[first - 1 : old_last] = [0] * (last - first + 1)
+        self.__text.tag_remove(self.tag, f"{first}.0", f"{last}.end")
+        self.__start(first, last)
+
+    def __start(self, first: int, last: Optional[int]) -> None:
+        snapshot = self.__text.get(f"{first}.0", "end-1c" if last is None else f"{last}.end")
+        self.__generation += 1
+        self.__job = _Job(self.__generation, first, last, self.__line_count())
+        Thread(target=self.__search, args=(self.__generation, snapshot, first), daemon=True).start()
+        if self.__poll_task_id is None:
+            self.__poll_task_id = self.__text.after(_POLL_INTERVAL, self.__poll)
+
+    def __search(self, generation: int, snapshot: str, first_line: int) -> None:
+        """Run in the worker thread, results are sent to the main thread through the queue."""
+        starts = line_starts(snapshot)
+        offsets: List[int] = []
+        for match in self.__pattern.finditer(snapshot):
+            if generation != self.__generation:
+                return
+            if match.end() > match.start():  # Empty matches cannot be highlighted
+                offsets.extend(match.span())
+            if len(offsets) >= _MATCH_BATCH_SIZE * 2:
+                self.__results.put((generation, offsets_to_indices(starts, offsets, first_line)))
+                offsets = []
+        if offsets:
+            self.__results.put((generation, offsets_to_indices(starts, offsets, first_line)))
+        self.__results.put((generation, None))
+
+    def __poll(self) -> None:
+        self.__poll_task_id = None
+        done = False
+        ranges: List[str] = []
+        while True:
+            try:
+                generation, indices = self.__results.get_nowait()
+            except Empty:
+                break
+            if generation != self.__generation:
+                continue
+            if indices is None:
+                done = True
+                continue
+            ranges.extend(indices)
+        # All batches received since the last poll are applied with a single call.
+        apply_tag_ranges(self.__text, "add", {self.tag: ranges})
+        self.match_count += len(ranges) // 2
+        line_matches = self.__line_matches
+        for start in ranges[::2]:
+            line = int(start.split(".", 1)[0])
+            if line <= len(line_matches):
+                line_matches[line - 1] += 1
+        if done:
+            self.__job = None
+            if self.__on_done is not None:
+                self.__on_done(self.match_count)
+        if self.__job is not None or self.__dirty is not None:
+            self.__poll_task_id = self.__text.after(_POLL_INTERVAL, self.__poll)
@@ -30,3 +30,789 @@ def test_configuration(app, style):
     app.update_idletasks()
     assert text.cget("selectbackground") == style.lookup("TEntry", "selectbackground", ["focus"])
     assert text.cget("selectforeground") == style.lookup("TEntry", "selectforeground", ["focus"])
+
+
+def test_style_lookup_cache(app, style):
+    from ttk_text._style import StyleLookupCache
+
+    cache = StyleLookupCache.of(app)
+    assert cache is StyleLookupCache.of(app)
+    style.configure("Cache.ThemedText.TEntry", fieldbackground="#010203")
+    assert cache.lookup("Cache.ThemedText.TEntry", "fieldbackground") == "#010203"
+    misses = cache.misses
+    assert cache.lookup("Cache.ThemedText.TEntry", "fieldbackground") == "#010203"
+    assert cache.misses == misses
+
+    style.configure("Cache.ThemedText.TEntry", fieldbackground="#040506")
+    assert cache.lookup("Cache.ThemedText.TEntry", "fieldbackground") == "#040506"
+    style.map("Cache.ThemedText.TEntry", fieldbackground=[("focus", "#070809")])
+    assert cache.lookup("Cache.ThemedText.TEntry", "fieldbackground", ["focus"]) == "#070809"
+
+
+def test_style_lookup_cache_releases_root():
+    import gc
+    import weakref
+    from tkinter import Tk
+
+    from ttk_text._style import StyleLookupCache
+
+    root = Tk()
+    StyleLookupCache.of(root)
+    root_ref = weakref.ref(root)
+    root.destroy()
+    del root
+    gc.collect()
+    assert root_ref() is None
+
+
+def test_style_change(app, style):
+    from ttk_text import ThemedText
+
+    style.configure("Custom.ThemedText.TEntry", fieldbackground="#0a0b0c")
+    text = ThemedText(app)
+    text.pack()
+    text.frame.configure(style="Custom.ThemedText.TEntry")
+    assert str(text.cget("background")) == "#0a0b0c"
+    text.destroy()
+
+
+def test_style_appearance_table(app, style):
+    from ttk_text._style import StyleLookupCache
+
+    cache = StyleLookupCache.of(app)
+    style.configure("Table.ThemedText.TEntry", fieldbackground="#111111")
+    style.map("Table.ThemedText.TEntry", fieldbackground=[("hover", "!focus", "#222222")])
+    assert cache.appearance("Table.ThemedText.TEntry", ()).background == "#111111"
+    misses = cache.misses
+    assert cache.appearance("Table.ThemedText.TEntry", ("hover",)).background == "#222222"
+    assert cache.appearance("Table.ThemedText.TEntry", ("hover", "focus")).background == "#111111"
+    assert cache.misses == misses
+
+
+def test_update_style_skips_unchanged_options(themed_text):
+    frame = themed_text.frame
+    frame.update_style()
+    skipped = frame.skipped_configure_count
+    frame.update_style()
+    # Text options, text padding, frame options and the stateful options are all unchanged.
+    assert frame.skipped_configure_count == skipped + 4
+
+
+def test_class_bindings(app):
+    from ttk_text import ThemedText
+
+    text1 = ThemedText(app, enable_class_bindings=True)
+    text1.pack()
+    text2 = ThemedText(app, enable_class_bindings=True)
+    text2.pack()
+    assert "ThemedTextFrameTransitionState" in text1.bindtags()
+    assert not text1.bind("<FocusIn>")
+    text1.focus()
+    text1.update()
+    assert "focus" in text1.frame.state()
+    text2.focus()
+    text2.update()
+    assert "focus" not in text1.frame.state()
+    assert "focus" in text2.frame.state()
+    text1.destroy()
+    text2.destroy()
+
+
+def test_theme_change_coordinator(app, style, themed_texts):
+    text1, text2 = themed_texts
+    coordinator = text1.frame.theme_change_coordinator
+    assert coordinator is text2.frame.theme_change_coordinator
+    passes = []
+    coordinator.on_restyled = lambda count, duration: passes.append(count)
+    style.theme_use("alt")
+    app.update()
+    style.theme_use("classic")
+    app.update()
+    coordinator.on_restyled = None
+    assert len(passes) == 2
+    assert all(count >= 2 for count in passes)
+
+
+def test_style_update_scheduler(themed_texts):
+    text1, text2 = themed_texts
+    scheduler = text1.frame.style_update_scheduler
+    assert scheduler is text2.frame.style_update_scheduler
+    text1.update()
+    flushes, merged = scheduler.flushes, scheduler.merged
+    for text in (text1, text2, text1, text2):
+        text.event_generate("<Enter>")
+        text.event_generate("<Leave>")
+    text1.update()
+    assert scheduler.flushes == flushes + 1
+    assert scheduler.merged == merged + 6
+
+
+def test_insert_stream(app, themed_text):
+    results = []
+    themed_text.insert("1.0", "end")
+    stream = themed_text.insert_stream(
+        "1.0",
+        (f"line {i}\n" if i % 2 else (f"line {i}\n", "even") for i in range(10000)),
+        on_done=results.append,
+    )
+    while not stream.finished:
+        app.update()
+    assert results == [True]
+    assert themed_text.get("1.0", "1.end") == "line 0"
+    assert themed_text.get("10000.0", "10000.end") == "line 9999"
+    assert themed_text.get("10001.0", "end-1c") == "end"
+    assert "even" in themed_text.tag_names("1.0")
+    assert "even" not in themed_text.tag_names("2.0")
+
+
+def test_insert_stream_cancel(app, themed_text):
+    results = []
+    stream = themed_text.insert_stream("end", iter(lambda: "x" * 1024, None), on_done=results.append)
+    app.update_idletasks()  # Run the first slice only
+    stream.cancel()
+    assert results == [False]
+    assert stream.inserted > 0
+
+
+def test_scrolled_text_append(app):
+    from ttk_text.scrolled_text import ScrolledText
+
+    text = ScrolledText(app, max_lines=100, state="disabled")
+    text.pack()
+    for i in range(1000):
+        text.append(f"line {i}\n", "even" if i % 2 == 0 else ())
+    app.update()
+    line_count = int(text.index("end-1c").split(".")[0]) - 1
+    assert 0 < line_count <= 100
+    assert text.get("end-2l linestart", "end-2l lineend") == "line 999"
+    assert "even" in text.tag_names("end-3l linestart")
+    assert text.yview()[1] == 1.0
+    assert str(text.cget("state")) == "disabled"
+    text.destroy()
+
+
+def test_scrolled_text_throttled_scrollbars(app):
+    import time
+
+    from ttk_text.scrolled_text import ScrolledText
+
+    text = ScrolledText(app, horizontal=True, wrap="none", throttle_scrollbars=True)
+    text.pack()
+    assert text.vbar is not None
+    assert text.hbar is not None
+    assert "throttled_call" in str(text.cget("yscrollcommand"))
+    for i in range(200):
+        text.insert("end", f"{'long ' * 50} line {i}\n")
+        text.see("end")
+        app.update_idletasks()
+    deadline = time.monotonic() + 1
+    while time.monotonic() < deadline:
+        app.update()
+    assert text.vbar.get() == text.yview()
+    assert text.hbar.get() == text.xview()
+    text.destroy()
+    app.update()
+
+
+def test_scrolled_text_auto_scrollbars(app):
+    import time
+
+    from ttk_text.scrolled_text import ScrolledText
+
+    def settle():
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            app.update()
+
+    text = ScrolledText(app, vertical="auto", horizontal="auto", wrap="none", height=10)
+    text.pack()
+    assert text.vbar is not None
+    assert text.hbar is not None
+    settle()
+    assert not text.vbar.winfo_ismapped()
+    assert not text.hbar.winfo_ismapped()
+
+    text.insert("1.0", "line\n" * 100)
+    settle()
+    assert text.vbar.winfo_ismapped()
+    assert not text.hbar.winfo_ismapped()
+    assert not text.corner.winfo_ismapped()
+
+    text.insert("1.0", "long " * 100)
+    settle()
+    assert text.hbar.winfo_ismapped()
+    assert text.corner.winfo_ismapped()
+
+    text.delete("1.0", "end")
+    settle()
+    assert not text.vbar.winfo_ismapped()
+    assert not text.hbar.winfo_ismapped()
+    text.destroy()
+
+
+def test_scrolled_text_auto_scrollbar_hides_after_edit(app):
+    import time
+
+    from ttk_text.scrolled_text import ScrolledText
+
+    def settle():
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            app.update()
+
+    text = ScrolledText(app, vertical=False, horizontal="auto", wrap="none", height=10)
+    text.pack()
+    assert text.hbar is not None
+    text.insert("1.0", "long " * 100)
+    settle()
+    assert text.hbar.winfo_ismapped()
+
+    # The line count and the outer size are unchanged, only the content width shrinks.
+    text.delete("1.5", "1.end")
+    settle()
+    assert not text.hbar.winfo_ismapped()
+    text.destroy()
+
+
+def test_scrolled_text_auto_scrollbar_quick_revert(app):
+    import time
+
+    from ttk_text.scrolled_text import ScrolledText
+
+    text = ScrolledText(app, vertical=False, horizontal="auto", wrap="none", height=10)
+    text.pack()
+    assert text.hbar is not None
+    text.insert("1.0", "long " * 100)
+    deadline = time.monotonic() + 0.5
+    while not text.hbar.winfo_ismapped() and time.monotonic() < deadline:
+        app.update()
+    assert text.hbar.winfo_ismapped()
+
+    # Removed before the pass letting the shown scrollbar settle.
+    text.delete("1.5", "1.end")
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline:
+        app.update()
+    assert not text.hbar.winfo_ismapped()
+    text.destroy()
+
+
+def test_text_sink(app, scrolled_text):
+    sink = scrolled_text.open_sink(max_buffered=64)
+    for i in range(100):
+        sink.write(f"line {i}\n")
+    sink.close()
+    app.update()
+    assert sink.inserted == sink.written
+    assert scrolled_text.get("end-2l linestart", "end-2l lineend") == "line 99"
+
+
+def test_text_sink_producer_thread(app, scrolled_text):
+    import threading
+
+    sink = scrolled_text.open_sink(max_buffered=64)
+    # Fill the buffer from the owner thread, which never blocks; the main loop is not running yet.
+    sink.write("x" * 100 + "\n")
+    errors = []
+
+    def blocked_producer():
+        try:
+            sink.write("blocked\n", timeout=0.1)
+        except TimeoutError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=blocked_producer)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
+
+    def producer():
+        for i in range(500):
+            sink.write(f"line {i}\n")
+        sink.close()
+
+    thread = threading.Thread(target=producer)
+
+    def poll():
+        if thread.is_alive() or sink.inserted < sink.written:
+            app.after(10, poll)
+        else:
+            app.quit()
+
+    thread.start()
+    app.after(10, poll)
+    timeout_id = app.after(10000, app.quit)
+    app.mainloop()
+    app.after_cancel(timeout_id)
+    thread.join()
+    app.update()
+    assert sink.inserted == sink.written
+    assert scrolled_text.get("end-2l linestart", "end-2l lineend") == "line 499"
+    assert "blocked" not in scrolled_text.get("1.0", "end")
+    assert not scrolled_text.bind("<<TextSinkReady>>")
+
+
+def test_file_viewer(app, tmp_path):
+    import pytest
+
+    from ttk_text.file_viewer import FileViewer
+
+    path = tmp_path / "large.log"
+    path.write_text("".join(f"line {i}\n" for i in range(100000)), encoding="utf-8")
+    viewer = FileViewer(app, path, window_lines=500)
+    viewer.pack()
+    while not viewer.indexing_complete:
+        app.update()
+    assert viewer.line_count == 100000
+    assert int(viewer.index("end-1c").split(".")[0]) <= 500
+    viewer.see_line(50000)
+    app.update()
+    assert viewer.get("@0,0 linestart", "@0,0 lineend") == "line 50000"
+    viewer.destroy()
+
+    with pytest.raises(ValueError, match="utf-16"):
+        FileViewer(app, path, encoding="utf-16")
+
+
+def test_text_search(app, themed_text):
+    from ttk_text.search import TextSearch
+
+    themed_text.insert("1.0", "".join(f"line {i}\n" for i in range(1000)))
+    results = []
+    search = TextSearch(themed_text, r"line \d*7\b", on_done=results.append)
+    search.search()
+    while search.running:
+        app.update()
+    assert results == [100]
+    assert themed_text.tag_nextrange(search.tag, "1.0") == ("8.0", "8.6")
+
+    themed_text.insert("8.5", "x")
+    search.refresh_lines(8, 8)
+    while search.running:
+        app.update()
+    assert search.match_count == 99
+
+
+def test_text_search_adjacent_matches(app, themed_text):
+    from ttk_text.search import TextSearch
+
+    themed_text.insert("1.0", "abab\nab\nabab")
+    search = TextSearch(themed_text, "ab")
+    search.search()
+    while search.running:
+        app.update()
+    assert search.match_count == 5
+
+    # Adjacent matches are merged into a single tag range, refreshes must not count them as one.
+    for _ in range(3):
+        search.refresh_lines(1, 3)
+        while search.running:
+            app.update()
+    assert search.match_count == 5
+
+    themed_text.insert("2.0", "ab\n")
+    search.refresh_lines(2, 3)
+    while search.running:
+        app.update()
+    assert search.match_count == 6
+    themed_text.delete("1.0", "3.0")
+    search.refresh_lines(1, 1)
+    while search.running:
+        app.update()
+    assert search.match_count == 3
+
+
+def test_tag_ranges(themed_text):
+    from array import array
+
+    themed_text.insert("1.0", "abc\ndef\nghi")
+    themed_text.tag_add_ranges("a", array("l", [1, 4]), array("l", [2, 6]))
+    assert [str(index) for index in themed_text.tag_ranges("a")] == ["1.1", "1.2", "2.0", "2.2"]
+    themed_text.tag_remove_ranges("a", ["2.0", "2.2"])
+    assert [str(index) for index in themed_text.tag_ranges("a")] == ["1.1", "1.2"]
+
+    themed_text.tag_add_spans([("b", "3.0", "3.1"), ("c", 0, 3), ("b", 5, 6)], base="2.0")
+    assert [str(index) for index in themed_text.tag_ranges("b")] == ["3.0", "3.2"]
+    assert [str(index) for index in themed_text.tag_ranges("c")] == ["2.0", "2.3"]
+    themed_text.tag_remove_spans([("b", "3.0", "3.2"), ("c", "2.0", "2.1")])
+    assert not themed_text.tag_ranges("b")
+    assert [str(index) for index in themed_text.tag_ranges("c")] == ["2.1", "2.3"]
+
+
+def test_edit_journal(app, themed_text):
+    from ttk_text._journal import LineChange
+
+    themed_text.insert("1.0", "a\nb\nc\n")
+    changes = []
+    themed_text.subscribe_changes(changes.append)
+    themed_text.insert("2.0", "x\ny\n")
+    themed_text.delete("5.0", "6.0")
+    app.update_idletasks()
+    assert changes == [LineChange(2, 4, 5)]
+
+    # Edits made by Tk bindings go through the widget command as well
+    themed_text.mark_set("insert", "3.0")
+    themed_text.tk.call("tk::TextInsert", themed_text._w, "z\n")
+    app.update_idletasks()
+    assert changes[-1] == LineChange(3, 3, 4)
+
+    # Distant edits are delivered separately, in order
+    changes.clear()
+    themed_text.insert("1.0", "top\n")
+    themed_text.insert("end", "\nbottom")
+    app.update_idletasks()
+    assert changes == [LineChange(1, 1, 2), LineChange(7, 7, 8)]
+    themed_text.unsubscribe_changes(changes.append)
+
+
+def test_highlighter(app, style, themed_text):
+    from typing import Hashable
+
+    from ttk_text.highlight import Highlighter
+
+    class BlockCommentLexer:
+        initial_state: Hashable = False
+
+        def lex_line(self, line, state):
+            if state:
+                end = line.find("*/")
+                if end < 0:
+                    return [(0, len(line), "Comment")], True
+                return [(0, end + 2, "Comment")], False
+            start = line.find("/*")
+            if start < 0:
+                return [], False
+            return [(start, len(line), "Comment")], "*/" not in line[start:]
+
+    style.configure("Comment.ThemedText.TEntry", foreground="#808080")
+    themed_text.insert("1.0", "".join(f"line {i}\n" for i in range(1000)))
+    highlighter = Highlighter(themed_text, BlockCommentLexer())
+    while highlighter.running:
+        app.update()
+    assert highlighter.lexed_lines >= 1001
+    assert str(themed_text.tag_cget("token.Comment", "foreground")) == "#808080"
+
+    # Typing on a line only lexes that line again
+    lexed_lines = highlighter.lexed_lines
+    themed_text.insert("500.0", "x")
+    while highlighter.running:
+        app.update()
+    assert highlighter.lexed_lines - lexed_lines == 1
+
+    # Opening a block comment lexes until the comment is closed
+    themed_text.insert("10.0", "/*")
+    themed_text.insert("20.end", "*/")
+    while highlighter.running:
+        app.update()
+    ranges = [str(index) for index in themed_text.tag_ranges("token.Comment")]
+    assert (ranges[0], ranges[-1], len(ranges)) == ("10.0", "20.9", 22)
+    themed_text.delete("10.0", "10.2")
+    while highlighter.running:
+        app.update()
+    assert not themed_text.tag_ranges("token.Comment")
+
+    # Edits far apart are lexed separately, not with the lines between them
+    lexed_lines = highlighter.lexed_lines
+    themed_text.insert("5.0", "x")
+    themed_text.insert("900.0", "x")
+    while highlighter.running:
+        app.update()
+    assert highlighter.lexed_lines - lexed_lines == 2
+    highlighter.close()
+
+
+def test_export(app, themed_text):
+    import io
+
+    content = "".join(f"line {i}\n" for i in range(1000))
+    themed_text.insert("1.0", content)
+    themed_text.tag_add("bold", "2.0", "3.0")
+    assert "".join(themed_text.iter_chunks(lines=100)) == content
+
+    file = io.BytesIO()
+    dump_file = io.BytesIO()
+    assert themed_text.export(file, encoding="utf-8", dump_file=dump_file, lines=64) == len(content)
+    assert file.getvalue() == content.encode()
+    dump = dump_file.getvalue().decode()
+    assert "tagon\tbold\t2.0\n" in dump
+    assert "tagoff\tbold\t3.0\n" in dump
+    assert "ttk_text_export" not in dump
+
+    file = io.StringIO()
+    results = []
+    export = themed_text.export_stream(file, "500.0", lines=10, on_done=results.append)
+    while not export.finished:
+        app.update()
+    assert results == [True]
+    assert file.getvalue() == content[content.index("line 499\n") :]
+    assert not [mark for mark in themed_text.mark_names() if mark.startswith("ttk_text_export")]
+
+
+def test_export_bom_encodings(themed_text):
+    import io
+
+    content = "".join(f"line {i} \u00e9\n" for i in range(100))
+    themed_text.insert("1.0", content)
+    for encoding in ("utf-16", "utf-8-sig"):
+        file = io.BytesIO()
+        assert themed_text.export(file, encoding=encoding, lines=10) == len(content)
+        assert file.getvalue() == content.encode(encoding)
+        assert file.getvalue().decode(encoding) == content
+
+
+def test_lazy_realization(app, style):
+    from ttk_text import ThemedText
+
+    style.configure("Lazy.ThemedText.TEntry", fieldbackground="#0d0e0f")
+    text = ThemedText(app, lazy=True, style="Lazy.ThemedText.TEntry")
+    app.update()
+    assert not text.frame.realized
+    assert not text.bind("<FocusIn>")
+    assert str(text.cget("background")) != "#0d0e0f"
+
+    text.pack()
+    app.update()
+    assert text.frame.realized
+    assert text.bind("<FocusIn>")
+    assert str(text.cget("background")) == "#0d0e0f"
+    assert not text.frame.bind("<Map>")
+    text.destroy()
+
+
+def test_instrumentation(app, style, themed_text):
+    from ttk_text import instrumentation
+
+    spans = []
+    instrumentation.reset()
+    instrumentation.enable(hook=spans.append)
+    try:
+        themed_text.frame.update_style()
+        themed_text.frame.update_style()
+        style.configure("Instrumented.ThemedText.TEntry", fieldbackground="#101112")
+        themed_text.frame.configure(style="Instrumented.ThemedText.TEntry")
+    finally:
+        instrumentation.disable()
+        instrumentation.set_span_hook(None)
+
+    frame_stats = instrumentation.stats(themed_text.frame)
+    assert frame_stats["update_style"].calls == 3
+    assert frame_stats["configure_skipped"].calls > 0
+    assert frame_stats["configure"].calls > 0
+    assert instrumentation.stats()["style_lookup"].calls > 0
+    assert any(span.name == "update_style" and span.owner is themed_text.frame for span in spans)
+    assert instrumentation.interpreter_counters(app)["style_cache_misses"] > 0
+
+    themed_text.frame.update_style()
+    assert instrumentation.stats(themed_text.frame)["update_style"].calls == 3
+    instrumentation.reset()
+    assert not instrumentation.stats()
+
+
+def test_bind_widget_idempotent(app, themed_text):
+    from tkinter.ttk import Scrollbar
+
+    scrollbar = Scrollbar(themed_text.frame)
+    scrollbar.bind("<Enter>", lambda _: None, "+")
+    themed_text.frame.bind_widget(scrollbar)
+    script = scrollbar.bind("<Enter>")
+    themed_text.frame.bind_widget(scrollbar)
+    assert scrollbar.bind("<Enter>") == script
+
+    commands = set(app.tk.splitlist(app.tk.call("info", "commands")))
+    themed_text.frame.unbind_widget(scrollbar)
+    assert len(scrollbar.bind("<Enter>").strip().splitlines()) == 1
+    assert not scrollbar.bind("<Destroy>").strip()
+    assert len(commands - set(app.tk.splitlist(app.tk.call("info", "commands")))) == 5
+    scrollbar.destroy()
+
+    themed_text.frame.unbind_text()
+    assert not themed_text.bind("<FocusIn>").strip()
+    themed_text.frame.bind_text(themed_text, themed_text.text_proxy())
+    assert themed_text.bind("<FocusIn>")
+
+
+def test_create_destroy_soak(app):
+    import gc
+    import tracemalloc
+
+    from ttk_text import ThemedText
+    from ttk_text.scrolled_text import ScrolledText
+
+    def cycle():
+        for widget_class in (ThemedText, ScrolledText):
+            text = widget_class(app)
+            text.pack()
+            text.insert("1.0", "text")
+            text.subscribe_changes(lambda _: None)
+            text.insert("end", "\nmore")
+            text.insert_stream("end", ["chunk"] * 10)
+            app.update_idletasks()
+            text.destroy()
+        app.update()
+
+    def counts():
+        gc.collect()
+        return (
+            len(app.tk.splitlist(app.tk.call("info", "commands"))),
+            len(app.tk.splitlist(app.tk.call("after", "info"))),
+            len(app.children),
+        )
+
+    for _ in range(5):
+        cycle()
+    before = counts()
+    tracemalloc.start()
+    for _ in range(10):
+        cycle()
+    gc.collect()
+    warm = tracemalloc.get_traced_memory()[0]
+    for _ in range(50):
+        cycle()
+    gc.collect()
+    growth = tracemalloc.get_traced_memory()[0] - warm
+    tracemalloc.stop()
+    assert counts() == before
+    assert growth < 64 * 1024
+
+
+def test_set_text(app):
+    from ttk_text import ThemedText
+
+    text = ThemedText(app, undo=True)
+    text.pack()
+    lines = [f"line {i}" for i in range(20000)]
+    text.insert("1.0", "\n".join(lines))
+    text.edit_separator()
+    text.tag_add("kept", "100.0", "100.end")
+    text.yview("5000.0")
+    app.update_idletasks()
+
+    done = []
+    lines[10000] = "changed"
+    del lines[15000:15002]
+    text.set_text("\n".join(lines), on_done=lambda: done.append(True))
+    while not done:
+        app.update()
+    assert text.get("1.0", "end-1c") == "\n".join(lines)
+    assert [str(index) for index in text.tag_ranges("kept")] == ["100.0", "100.8"]
+    assert text.index("@0,0") == "5000.0"
+
+    text.set_text("a\nb")
+    assert text.get("1.0", "end-1c") == "a\nb"
+    text.edit_undo()
+    assert text.get("1.0", "end-1c") == "\n".join(lines)
+    text.destroy()
+
+
+def test_chunked_paste(app):
+    from ttk_text import ThemedText
+
+    text = ThemedText(app, undo=True)
+    text.pack()
+    text.insert("1.0", "before|after")
+    text.edit_separator()
+    text.mark_set("insert", "1.7")
+    progress = []
+    done = []
+    handler = text.enable_chunked_paste(
+        threshold=1000,
+        on_progress=lambda inserted, total: progress.append((inserted, total)),
+        on_done=done.append,
+    )
+
+    app.clipboard_clear()
+    app.clipboard_append("small")
+    text.event_generate("<<Paste>>")
+    assert text.get("1.0", "end-1c") == "before|smallafter"
+    assert not handler.active
+
+    payload = "pasted line\n" * 50000
+    app.clipboard_clear()
+    app.clipboard_append(payload)
+    text.event_generate("<<Paste>>")
+    assert handler.active
+    while not done:
+        app.update()
+    assert done == [True]
+    assert progress[-1] == (len(payload), len(payload))
+    assert text.get("1.0", "end-1c") == "before|small" + payload + "after"
+    assert text.index("insert") == text.index(f"1.12 +{len(payload)}c")
+    assert text.cget("autoseparators")
+
+    text.edit_undo()
+    assert text.get("1.0", "end-1c") == "before|smallafter"
+
+    text.configure(state="disabled")
+    app.clipboard_clear()
+    app.clipboard_append("y" * 2000)
+    text.event_generate("<<Paste>>")
+    assert not handler.active
+    assert text.get("1.0", "end-1c") == "before|smallafter"
+    text.configure(state="normal")
+
+    handler.remove()
+    app.clipboard_clear()
+    app.clipboard_append("x" * 2000)
+    text.event_generate("<<Paste>>")
+    assert len(text.get("1.0", "end-1c")) == len("before|smallafter") + 2000
+    text.destroy()
+
+
+def test_line_number_gutter(app):
+    import time
+
+    from ttk_text.gutter import LineNumberGutter
+    from ttk_text.scrolled_text import ScrolledText
+
+    def settle():
+        deadline = time.monotonic() + 0.1
+        while time.monotonic() < deadline:
+            app.update()
+
+    def numbers():
+        items = [item for item in gutter.find_all() if gutter.itemcget(item, "state") != "hidden"]
+        return sorted(int(gutter.itemcget(item, "text")) for item in items)
+
+    text = ScrolledText(app, height=10)
+    text.pack()
+    assert text.vbar is not None
+    text.insert("1.0", "\n".join(f"line {i}" for i in range(1, 1001)))
+    yscrollcommand = str(text.cget("yscrollcommand"))
+    gutter = LineNumberGutter(text)
+    settle()
+    assert gutter.grid_info()["column"] == 0
+    assert numbers()[0] == 1
+    assert len(numbers()) <= 11
+    width = int(gutter.cget("width"))
+
+    text.yview("500.0")
+    settle()
+    assert numbers()[0] == 500
+    assert text.vbar.get() == text.yview()
+
+    text.insert("500.0", "inserted\n")
+    settle()
+    assert numbers()[0] == 500
+    assert text.get("501.0", "501.end") == "line 500"
+
+    text.insert("end", "\nmore" * 10000)
+    settle()
+    assert int(gutter.cget("width")) > width
+
+    gutter.destroy()
+    assert str(text.cget("yscrollcommand")) == yscrollcommand
+    text.destroy()
+
+    # The scroll commands of a throttled text stay in Tcl until the throttled hook runs.
+    text = ScrolledText(app, height=10, throttle_scrollbars=True)
+    text.pack()
+    assert text.vbar is not None
+    text.insert("1.0", "\n".join(f"line {i}" for i in range(1, 1001)))
+    gutter = LineNumberGutter(text)
+    assert "throttled_call" in str(text.cget("yscrollcommand"))
+    text.yview("300.0")
+    settle()
+    assert numbers()[0] == 300
+    assert text.vbar.get() == text.yview()
+    gutter.destroy()
+    text.destroy()
@@ -0,0 +1,14 @@
+from ttk_text._diff import line_opcodes
+
+
+class TestLineOpcodes:
+    def test_unchanged(self):
+        assert line_opcodes(["a", "b"], ["a", "b"]) == []
+
+    def test_changed_line(self):
+        old = [f"line {i}" for i in range(1000)]
+        new = [*old[:500], "changed", *old[501:]]
+        assert line_opcodes(old, new) == [(500, 501, 500, 501)]
+
+    def test_inserted_and_deleted_lines(self):
+        assert line_opcodes(["a", "b", "c"], ["a", "x", "b"]) == [(1, 1, 1, 2), (2, 3, 3, 3)]
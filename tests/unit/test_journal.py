@@ -0,0 +1,15 @@
+from ttk_text._journal import LineChange
+
+
+class TestLineChange:
+    def test_merge_disjoint(self):
+        # Insert two lines after line 10, then edit line 2
+        assert LineChange(10, 10, 12).merge(LineChange(2, 2, 2)) == LineChange(2, 10, 12)
+        # Edit line 2, then delete lines 10-11 of the new text
+        assert LineChange(2, 2, 3).merge(LineChange(10, 11, 10)) == LineChange(2, 10, 10)
+
+    def test_merge_overlapping(self):
+        # Insert two lines after line 5, then edit the second inserted line
+        assert LineChange(5, 5, 7).merge(LineChange(6, 6, 6)) == LineChange(5, 5, 7)
+        # Insert two lines after line 5, then delete them again
+        assert LineChange(5, 5, 7).merge(LineChange(5, 7, 5)) == LineChange(5, 5, 5)
@@ -47,3 +47,19 @@ class TestParsePadding:
     def test_parse_none(self):
         result = parse_padding(None)
         assert result is None
+
+
+class TestOffsetsToIndices:
+    def test_line_starts(self):
+        from ttk_text._utils import line_starts
+
+        assert line_starts("") == [0]
+        assert line_starts("ab\ncd\n") == [0, 3, 6]
+
+    def test_offsets_to_indices(self):
+        from ttk_text._utils import line_starts, offsets_to_indices
+
+        text = "ab\ncd\nef"
+        starts = line_starts(text)
+        assert offsets_to_indices(starts, [0, 2, 3, 7]) == ["1.0", "1.2", "2.0", "3.1"]
+        assert offsets_to_indices(starts, [7, 1], first_line=10) == ["12.1", "10.1"]